@@ -7,13 +7,12 @@ This module contains commands for managing configuration files.
 import click
 import json
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ..utils import Config
+from ..utils import Config, json_loads, get_console
 
-console = Console()
+console = get_console()
 
 
 @click.group()
@@ -147,8 +146,7 @@ def import_config(input: str, config: str, force: bool):
             return
     
     try:
-        with open(input_path, 'r') as f:
-            config_data = json.load(f)
+        config_data = json_loads(input_path.read_bytes())
         
         # Create configuration from imported data
         imported_config = Config(
@@ -7,14 +7,13 @@ This module contains commands for running tests and managing test scenarios.
 import click
 import sys
 from pathlib import Path
-from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from ..core import TestRunner
-from ..utils import Config, get_log_file_path
+from ..utils import Config, get_log_file_path, get_console
 
-console = Console()
+console = get_console()
 
 
 @click.group()
@@ -11,15 +11,14 @@ from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
 from ..translation import ProjectTranslator
 from ..translation.llm_providers import OpenAIProvider, AnthropicProvider, OpenAIGPT5Provider
-from ..utils import get_logger, Config
+from ..utils import get_logger, Config, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("translation_commands")
 
 
@@ -39,11 +38,16 @@ def translate():
 @click.option('--save-conversation', type=bool, help='Save conversation to file (overrides config)')
 @click.option('--conversation-file', help='Conversation file name (overrides config)')
 @click.option('--test-cases', help='Path to test cases file for automatic testing (overrides config)')
+@click.option('--cache-dir', help='Directory for cached LLM responses and test results (overrides config)')
+@click.option('--request-timeout', type=float, help='Timeout in seconds for each batch LLM call (overrides config)')
+@click.option('--max-output-tokens', type=int, help='Output token limit for each batch LLM call (overrides config)')
 @click.option('--config', help='Configuration file path')
 @click.pass_context
 def translate_project(ctx, source: str, output: str, from_lang: str, to_lang: str,
                      method: Optional[str], max_iterations: Optional[int], save_conversation: Optional[bool],
-                     conversation_file: Optional[str], test_cases: Optional[str], config: Optional[str]):
+                     conversation_file: Optional[str], test_cases: Optional[str], cache_dir: Optional[str],
+                     request_timeout: Optional[float], max_output_tokens: Optional[int],
+                     config: Optional[str]):
     """Translate a project from one programming language to another."""
     
     try:
@@ -68,6 +72,12 @@ def translate_project(ctx, source: str, output: str, from_lang: str, to_lang: st
             translation_config.conversation_file = conversation_file
         if test_cases is not None:
             translation_config.test_cases_path = test_cases
+        if cache_dir is not None:
+            translation_config.cache_dir = cache_dir
+        if request_timeout is not None:
+            translation_config.request_timeout = request_timeout
+        if max_output_tokens is not None:
+            translation_config.max_output_tokens = max_output_tokens
         
         # Validate API key
         if not llm_config.api_key:
@@ -129,6 +139,9 @@ def translate_project(ctx, source: str, output: str, from_lang: str, to_lang: st
             f"[bold]Conversation File:[/bold] {translation_config.conversation_file}\n"
             f"[bold]Auto Testing:[/bold] {translation_config.enable_auto_testing}\n"
             f"[bold]Test Cases:[/bold] {translation_config.test_cases_path or 'None'}\n"
+            f"[bold]Cache Dir:[/bold] {translation_config.cache_dir or 'None'}\n"
+            f"[bold]Request Timeout:[/bold] {translation_config.request_timeout or 'Default'}\n"
+            f"[bold]Max Output Tokens:[/bold] {translation_config.max_output_tokens or 'Default'}\n"
             f"[bold]Source Path:[/bold] {source_path}\n"
             f"[bold]Output Path:[/bold] {output_path}",
             title="Translation Configuration",
@@ -149,7 +162,10 @@ def translate_project(ctx, source: str, output: str, from_lang: str, to_lang: st
             max_retries=translation_config.max_retries,
             retry_delay=translation_config.retry_delay,
             test_cases_path=translation_config.test_cases_path,
-            enable_auto_testing=translation_config.enable_auto_testing
+            enable_auto_testing=translation_config.enable_auto_testing,
+            cache_dir=translation_config.cache_dir,
+            request_timeout=translation_config.request_timeout,
+            max_output_tokens=translation_config.max_output_tokens
         )
         
         # Display results
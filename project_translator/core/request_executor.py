@@ -7,11 +7,10 @@ responses according to test case specifications.
 
 import requests
 from typing import Dict, List, Any, Optional
-from rich.console import Console
 from ..models import TestStep
-from ..utils import get_logger
+from ..utils import get_logger, get_console, ResponseValidator
 
-console = Console()
+console = get_console()
 
 
 class RequestExecutor:
@@ -109,7 +108,7 @@ class RequestExecutor:
         """
         try:
             logger = get_logger("request_executor")
-            logger.debug(f"Making {method} request to {url} with headers {headers} and body {body}")
+            logger.debug("Making %s request to %s with headers %s and body %s", method, url, headers, body)
             if method.upper() == "GET":
                 return requests.get(url, headers=headers, timeout=10)
             elif method.upper() == "POST":
@@ -177,10 +176,23 @@ class RequestExecutor:
     
     def _replace_placeholders(self, text: str, saved_data: Dict[str, Any]) -> str:
         """Replace placeholders in text with saved data."""
-        for key, value in saved_data.items():
-            placeholder = f"{{saved_{key}}}"
-            text = text.replace(placeholder, str(value))
-        return text
+        # Most strings have no placeholder at all; otherwise split once on
+        # the literal marker and resolve each {saved_<key>} in a single pass
+        if "{saved_" not in text:
+            return text
+        
+        segments = text.split("{saved_")
+        parts = [segments[0]]
+        for segment in segments[1:]:
+            end = segment.find("}")
+            key = segment[:end] if end != -1 else None
+            if key is not None and key in saved_data:
+                parts.append(str(saved_data[key]))
+                parts.append(segment[end + 1:])
+            else:
+                parts.append("{saved_")
+                parts.append(segment)
+        return "".join(parts)
     
     def _replace_placeholders_dict(self, data: Dict[str, Any], saved_data: Dict[str, Any]) -> Dict[str, Any]:
         """Replace placeholders in dictionary values."""
@@ -193,41 +205,20 @@ class RequestExecutor:
     
     def _check_response_content(self, response_data: Any, expected: Dict[str, Any]) -> bool:
         """Check if response matches expected content."""
-        if not isinstance(response_data, dict):
-            return False
-        
-        for key, expected_value in expected.items():
-            if key not in response_data:
-                return False
-            if response_data[key] != expected_value:
-                return False
-        
-        return True
+        return ResponseValidator.validate_response_structure(response_data, expected)
     
     def _check_response_contains(self, response_data: Any, expected_keys: List[str]) -> bool:
         """Check if response contains expected keys."""
-        if isinstance(response_data, dict):
-            return all(key in response_data for key in expected_keys)
-        elif isinstance(response_data, str):
-            return all(key in response_data for key in expected_keys)
-        return False
+        return ResponseValidator.validate_response_contains(response_data, expected_keys)
     
     def _check_response_type(self, response_data: Any, expected_type: str) -> bool:
         """Check if response is of expected type."""
-        if expected_type == "array":
-            return isinstance(response_data, list)
-        elif expected_type == "object":
-            return isinstance(response_data, dict)
-        return False
+        return ResponseValidator.validate_response_type(response_data, expected_type)
     
     def _check_min_items(self, response_data: Any, min_count: int) -> bool:
         """Check if response has minimum number of items."""
-        if isinstance(response_data, list):
-            return len(response_data) >= min_count
-        return False
+        return ResponseValidator.validate_item_count(response_data, min_count, min_count)
     
     def _check_exact_items(self, response_data: Any, exact_count: int) -> bool:
         """Check if response has exact number of items."""
-        if isinstance(response_data, list):
-            return len(response_data) == exact_count
-        return False
+        return ResponseValidator.validate_item_count(response_data, exact_count)
@@ -9,12 +9,13 @@ import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-console = Console()
+from ..utils import get_console
+
+console = get_console()
 
 
 class ResultHandler:
@@ -5,16 +5,16 @@ This module provides functionality to start, monitor, and stop test services
 using their startup and shutdown scripts.
 """
 
+import os
 import subprocess
 import time
 import requests
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
 
-from ..utils import get_logger
+from ..utils import get_logger, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("service_manager")
 
 
@@ -43,21 +43,19 @@ class ServiceManager:
         Returns:
             True if scripts are valid, False otherwise
         """
-        if not self.start_script.exists():
-            console.print(f"[red]Error: start.sh not found: {self.start_script}[/red]")
-            return False
-            
-        if not self.shutdown_script.exists():
-            console.print(f"[red]Error: shutdown.sh not found: {self.shutdown_script}[/red]")
-            return False
-            
-        if not self.start_script.stat().st_mode & 0o111:
-            console.print(f"[red]Error: start.sh is not executable: {self.start_script}[/red]")
-            return False
+        # One stat per script answers both the existence and the mode check
+        script_modes = {}
+        for script in (self.start_script, self.shutdown_script):
+            try:
+                script_modes[script] = os.stat(script).st_mode
+            except OSError:
+                console.print(f"[red]Error: {script.name} not found: {script}[/red]")
+                return False
             
-        if not self.shutdown_script.stat().st_mode & 0o111:
-            console.print(f"[red]Error: shutdown.sh is not executable: {self.shutdown_script}[/red]")
-            return False
+        for script, mode in script_modes.items():
+            if not mode & 0o111:
+                console.print(f"[red]Error: {script.name} is not executable: {script}[/red]")
+                return False
             
         return True
     
@@ -8,22 +8,22 @@ service management, test execution, and result handling.
 import json
 from pathlib import Path
 from typing import Dict, List, Any, Optional
-from rich.console import Console
 
 from .service_manager import ServiceManager
 from .request_executor import RequestExecutor
 from .result_handler import ResultHandler
-from ..utils import get_logger
+from ..utils import get_logger, get_console
 from ..models import TestSuite, TestScenario, TestStep
 
-console = Console()
+console = get_console()
 logger = get_logger("test_runner")
 
 
 class TestRunner:
     """Orchestrates test execution against CRUD services."""
     
-    def __init__(self, test_project_path: str, test_cases_path: str, base_url: str = "http://localhost:8000"):
+    def __init__(self, test_project_path: str, test_cases_path: str, base_url: str = "http://localhost:8000",
+                 test_suite: Optional[TestSuite] = None):
         """
         Initialize the test runner.
         
@@ -31,10 +31,13 @@ class TestRunner:
             test_project_path: Path to test project directory
             test_cases_path: Path to test cases JSON file
             base_url: Base URL for API requests
+            test_suite: Already loaded test cases (optional, loaded from
+                        test_cases_path if None)
         """
         self.test_project_path = Path(test_project_path).resolve()
         self.test_cases_path = Path(test_cases_path).resolve()
         self.base_url = base_url
+        self.test_suite = test_suite
         
         # Initialize components
         scripts_dir = self.test_project_path.parent
@@ -44,14 +47,17 @@ class TestRunner:
         
         self.results = []
     
-    def validate_paths(self) -> bool:
+    def validate_paths(self, check_scripts: bool = True) -> bool:
         """
         Validate that required paths exist.
         
+        Args:
+            check_scripts: Whether to also validate the service scripts
+        
         Returns:
             True if paths are valid, False otherwise
         """
-        logger.debug(f"Validating paths: project={self.test_project_path}, cases={self.test_cases_path}")
+        logger.debug("Validating paths: project=%s, cases=%s", self.test_project_path, self.test_cases_path)
         
         if not self.test_project_path.exists():
             error_msg = f"Test project path does not exist: {self.test_project_path}"
@@ -65,6 +71,8 @@ class TestRunner:
             console.print(f"[red]Error: {error_msg}[/red]")
             return False
         
+        if not check_scripts:
+            return True
         return self.service_manager.validate_scripts()
     
     def load_test_cases(self) -> Optional[TestSuite]:
@@ -74,8 +82,11 @@ class TestRunner:
         Returns:
             TestSuite instance or None if error
         """
+        if self.test_suite is not None:
+            return self.test_suite
+        
         try:
-            logger.debug(f"Loading test cases from: {self.test_cases_path}")
+            logger.debug("Loading test cases from: %s", self.test_cases_path)
             test_suite = TestSuite.load(str(self.test_cases_path))
             logger.info(f"Successfully loaded test cases: {len(test_suite.scenarios)} scenarios")
             return test_suite
@@ -115,7 +126,7 @@ class TestRunner:
         
         for i, step in enumerate(steps, 1):
             step_name = step.name
-            logger.debug(f"Executing step {i}: {step_name}")
+            logger.debug("Executing step %d: %s", i, step_name)
             console.print(f"  [blue]Step {i}: {step_name}[/blue]")
             
             try:
@@ -166,16 +177,21 @@ class TestRunner:
             "passed_steps": passed_steps
         }
     
-    def run_tests(self) -> Dict[str, Any]:
+    def run_tests(self, manage_service: bool = True) -> Dict[str, Any]:
         """
         Run all test scenarios.
         
+        Args:
+            manage_service: Whether to start the service before the scenarios
+                            and shut it down afterwards; False when the caller
+                            already started it
+        
         Returns:
             Complete test execution results
         """
         logger.info("Starting test execution")
         
-        if not self.validate_paths():
+        if not self.validate_paths(check_scripts=manage_service):
             error_msg = "Path validation failed"
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
@@ -195,20 +211,21 @@ class TestRunner:
         logger.info(f"Found {len(scenarios)} test scenarios")
         console.print(f"[green]Found {len(scenarios)} test scenarios[/green]")
         
-        # Start service
-        logger.info("Starting test service")
-        if not self.service_manager.start_service():
-            error_msg = "Failed to start service"
-            logger.error(error_msg)
-            return {"success": False, "error": error_msg}
-        
-        # Wait for service to be ready
-        logger.info("Waiting for service to be ready")
-        if not self.service_manager.wait_for_service():
-            error_msg = "Service failed to become ready"
-            logger.error(error_msg)
-            self.service_manager.shutdown_service()
-            return {"success": False, "error": error_msg}
+        if manage_service:
+            # Start service
+            logger.info("Starting test service")
+            if not self.service_manager.start_service():
+                error_msg = "Failed to start service"
+                logger.error(error_msg)
+                return {"success": False, "error": error_msg}
+            
+            # Wait for service to be ready
+            logger.info("Waiting for service to be ready")
+            if not self.service_manager.wait_for_service():
+                error_msg = "Service failed to become ready"
+                logger.error(error_msg)
+                self.service_manager.shutdown_service()
+                return {"success": False, "error": error_msg}
         
         logger.info("Service is ready, starting test scenarios")
         
@@ -244,9 +261,10 @@ class TestRunner:
             logger.error(f"Unexpected error during test execution: {str(e)}", exc_info=True)
             overall_success = False
         finally:
-            # Always shutdown service
-            logger.info("Shutting down test service")
-            self.service_manager.shutdown_service()
+            # Always shutdown a service started here
+            if manage_service:
+                logger.info("Shutting down test service")
+                self.service_manager.shutdown_service()
         
         passed_scenarios = sum(1 for r in scenario_results if r["success"])
         logger.info(f"Test execution completed: {passed_scenarios}/{len(scenarios)} scenarios passed")
@@ -5,14 +5,13 @@ This module provides the main CLI interface and command routing.
 """
 
 import click
-from rich.console import Console
 from rich.panel import Panel
 
 from .commands import test_group, config_group
 from .commands.translation_commands import translate
-from .utils import Config, setup_logging, get_logger
+from .utils import Config, setup_logging, get_logger, get_console
 
-console = Console()
+console = get_console()
 
 
 @click.group()
@@ -77,6 +77,9 @@ class TranslationConfig:
     retry_delay: float = 1.0  # seconds
     enable_auto_testing: bool = True
     test_cases_path: Optional[str] = None
+    cache_dir: Optional[str] = None  # LLM response and test result cache
+    request_timeout: Optional[float] = None  # seconds per batch LLM call
+    max_output_tokens: Optional[int] = None  # per batch LLM call
     
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -96,6 +99,12 @@ class TranslationConfig:
         
         if self.retry_delay < 0:
             raise ValueError('Retry delay must be non-negative')
+        
+        if self.request_timeout is not None and self.request_timeout <= 0:
+            raise ValueError('Request timeout must be positive')
+        
+        if self.max_output_tokens is not None and self.max_output_tokens <= 0:
+            raise ValueError('Max output tokens must be positive')
 
 
 @dataclass
@@ -146,6 +155,7 @@ class Config(AppConfig):
             ValueError: If config file contains invalid data
         """
         import json
+        from ..utils.serialization import json_loads
         
         config_file = Path(config_path) if config_path else Path("config.json")
         
@@ -156,8 +166,7 @@ class Config(AppConfig):
             return default_config
         
         try:
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data = json_loads(config_file.read_bytes())
             
             # Parse logging configuration
             logging_data = config_data.get("logging", {})
@@ -237,7 +246,10 @@ class Config(AppConfig):
                 "max_retries": self.translation.max_retries,
                 "retry_delay": self.translation.retry_delay,
                 "enable_auto_testing": self.translation.enable_auto_testing,
-                "test_cases_path": self.translation.test_cases_path
+                "test_cases_path": self.translation.test_cases_path,
+                "cache_dir": self.translation.cache_dir,
+                "request_timeout": self.translation.request_timeout,
+                "max_output_tokens": self.translation.max_output_tokens
             }
         }
         
@@ -279,6 +291,9 @@ class Config(AppConfig):
                 "max_retries": self.translation.max_retries,
                 "retry_delay": self.translation.retry_delay,
                 "enable_auto_testing": self.translation.enable_auto_testing,
-                "test_cases_path": self.translation.test_cases_path
+                "test_cases_path": self.translation.test_cases_path,
+                "cache_dir": self.translation.cache_dir,
+                "request_timeout": self.translation.request_timeout,
+                "max_output_tokens": self.translation.max_output_tokens
             }
         }
\ No newline at end of file
@@ -142,14 +142,14 @@ class TestSuite:
         """
         import json
         from pathlib import Path
+        from ..utils.serialization import json_loads
         
         test_file = Path(file_path)
         if not test_file.exists():
             raise FileNotFoundError(f"Test cases file not found: {file_path}")
         
         try:
-            with open(test_file, 'r') as f:
-                data = json.load(f)
+            data = json_loads(test_file.read_bytes())
             
             # Parse scenarios
             scenarios = []
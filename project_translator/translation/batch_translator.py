@@ -8,18 +8,17 @@ in one request to reduce token usage and improve efficiency.
 import json
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
-from rich.console import Console
+from typing import Dict, Any, Optional, Iterator, List
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
 from .llm_providers.base import BaseLLMProvider
-from .protocols.batch import BatchTranslationProtocol, BatchTranslationRequest, BatchTranslationResponse
+from .protocols.batch import BatchTranslationProtocol, BatchTranslationRequest, BatchTranslationResponse, TranslatedFile
 from .protocols.mcp import MCPMessage, MCPMessageType
 from .tools.file_operations import FileOperationsTool
 from .retry_mechanism import RetryMechanism
-from project_translator.utils import get_logger, error_with_stacktrace
+from project_translator.utils import get_logger, error_with_stacktrace, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("batch_translator")
 
 
@@ -62,29 +61,15 @@ class BatchProjectTranslator:
             Response text from LLM
         """
         try:
-            # Format the request as a single message
-            request_text = self._format_batch_request(batch_request)
-            
-            messages = [
-                MCPMessage(
-                    role=MCPMessageType.SYSTEM,
-                    content=batch_request.translation_instructions,
-                    id="batch_system"
-                ),
-                MCPMessage(
-                    role=MCPMessageType.USER,
-                    content=request_text,
-                    id="batch_request"
-                )
-            ]
+            messages = self._build_batch_messages(batch_request)
             
             response = self.llm_provider.send_message(messages)
             
             # Extract response text
-            response_text = ""
-            for message in response.messages:
-                if message.role == MCPMessageType.ASSISTANT:
-                    response_text += str(message.content)
+            response_text = "".join(
+                str(message.content) for message in response.messages
+                if message.role == MCPMessageType.ASSISTANT
+            )
             
             return response_text
                 
@@ -93,6 +78,82 @@ class BatchProjectTranslator:
             error_with_stacktrace(error_msg, e)
             raise
     
+    def _stream_batch_request(self, batch_request: BatchTranslationRequest) -> Iterator[str]:
+        """
+        Send batch translation request and stream the response text.
+        
+        Args:
+            batch_request: BatchTranslationRequest object
+            
+        Yields:
+            Chunks of response text from LLM
+        """
+        try:
+            messages = self._build_batch_messages(batch_request)
+            yield from self.llm_provider.stream_text(messages)
+                
+        except Exception as e:
+            error_msg = f"Error streaming batch request: {str(e)}"
+            error_with_stacktrace(error_msg, e)
+            raise
+    
+    def _build_batch_messages(self, batch_request: BatchTranslationRequest) -> List[MCPMessage]:
+        """
+        Build the system and user messages for a batch request.
+        
+        Args:
+            batch_request: BatchTranslationRequest object
+            
+        Returns:
+            List of messages to send to the LLM
+        """
+        # Format the request as a single message
+        request_text = self._format_batch_request(batch_request)
+        
+        return [
+            MCPMessage(
+                role=MCPMessageType.SYSTEM,
+                content=batch_request.translation_instructions,
+                id="batch_system"
+            ),
+            MCPMessage(
+                role=MCPMessageType.USER,
+                content=request_text,
+                id="batch_request"
+            )
+        ]
+    
+    def _write_translated_file(self, output_path: str, translated_file: TranslatedFile) -> bool:
+        """
+        Write a single translated file to the output directory.
+        
+        Args:
+            output_path: Path to output project
+            translated_file: TranslatedFile to write
+            
+        Returns:
+            True if the file was written, False otherwise
+        """
+        try:
+            # Use the path from translation
+            output_file_path = Path(output_path) / translated_file.path
+            
+            # Ensure parent directory exists
+            output_file_path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # Write file
+            output_file_path.write_text(translated_file.content, encoding='utf-8')
+            
+            # The translated path is already relative to the output directory
+            console.print(f"[green]✅ Written: {translated_file.path}[/green]")
+            return True
+            
+        except Exception as e:
+            error_msg = f"Error writing file {translated_file.path}: {str(e)}"
+            error_with_stacktrace(error_msg, e)
+            console.print(f"[red]❌ {error_msg}[/red]")
+            return False
+    
     def _format_batch_request(self, batch_request: BatchTranslationRequest) -> str:
         """
         Format batch request for LLM.
@@ -103,17 +164,19 @@ class BatchProjectTranslator:
         Returns:
             Formatted request text
         """
-        import json
-        
-        formatted = f"Please translate this project from {batch_request.source_language} to {batch_request.target_language}:\n\n"
-        formatted += f"PROJECT FILES ({len(batch_request.project_files)} files):\n\n"
+        project_files = batch_request.project_files
+        parts = [
+            f"Please translate this project from {batch_request.source_language} to {batch_request.target_language}:\n\n",
+            f"PROJECT FILES ({len(project_files)} files):\n\n"
+        ]
         
-        for i, file_data in enumerate(batch_request.project_files, 1):
-            formatted += f"--- FILE {i}: {file_data.path} ({file_data.file_type}) ---\n"
-            formatted += file_data.content
-            formatted += "\n\n"
+        # Collect the pieces and join once instead of growing one string
+        for i, file_data in enumerate(project_files, 1):
+            parts.append(f"--- FILE {i}: {file_data.path} ({file_data.file_type}) ---\n")
+            parts.append(file_data.content)
+            parts.append("\n\n")
         
-        return formatted
+        return "".join(parts)
     
     def translate_project(self, source_path: str, output_path: str, 
                          max_iterations: int = 50,
@@ -125,7 +188,10 @@ class BatchProjectTranslator:
                          max_retries: int = 3,
                          retry_delay: float = 1.0,
                          test_cases_path: Optional[str] = None,
-                         enable_auto_testing: bool = True) -> Dict[str, Any]:
+                         enable_auto_testing: bool = True,
+                         cache_dir: Optional[str] = None,
+                         request_timeout: Optional[float] = None,
+                         max_output_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
         Translate a project using batch translation with optional automatic testing and retry.
         
@@ -142,6 +208,9 @@ class BatchProjectTranslator:
             retry_delay: Delay between retries (not used in batch mode)
             test_cases_path: Path to test cases file for automatic testing
             enable_auto_testing: Whether to enable automatic testing and retry
+            cache_dir: Directory for cached LLM responses and test results
+            request_timeout: Timeout in seconds for each LLM call (retry mode only)
+            max_output_tokens: Output token limit for each LLM call (retry mode only)
             
         Returns:
             Dictionary with translation results
@@ -169,7 +238,10 @@ class BatchProjectTranslator:
                     self.source_lang, 
                     self.target_lang,
                     max_retries=max_retries,
-                    test_cases_path=test_cases_path
+                    test_cases_path=test_cases_path,
+                    cache_dir=cache_dir,
+                    per_call_timeout=request_timeout,
+                    max_output_tokens=max_output_tokens
                 )
                 
                 result = retry_mechanism.translate_with_retry(
@@ -210,35 +282,22 @@ class BatchProjectTranslator:
                     
                     self.translation_stats["files_read"] = len(batch_request.project_files)
                     
-                    # Send single request to LLM
-                    response_text = self._send_batch_request(batch_request)
-                    
-                    # Parse response
+                    # Stream the response so long replies keep the connection
+                    # busy, then parse it with the same strict-then-lenient
+                    # decoding used everywhere else
+                    response_text = "".join(self._stream_batch_request(batch_request))
                     batch_response = self.batch_protocol.parse_translation_response(response_text)
                 
+                if not batch_response.translated_files:
+                    raise ValueError("No translated files found in response")
+                
                 # Write translated files
                 console.print(f"[blue]📝 Writing {len(batch_response.translated_files)} translated files...[/blue]")
                 
                 written_files = 0
                 for translated_file in batch_response.translated_files:
-                    try:
-                        # Use the path from translation
-                        output_file_path = Path(output_path) / translated_file.path
-                        
-                        # Ensure parent directory exists
-                        output_file_path.parent.mkdir(parents=True, exist_ok=True)
-                        
-                        # Write file
-                        with open(output_file_path, 'w', encoding='utf-8') as f:
-                            f.write(translated_file.content)
-                        
+                    if self._write_translated_file(output_path, translated_file):
                         written_files += 1
-                        console.print(f"[green]✅ Written: {output_file_path.relative_to(Path(output_path))}[/green]")
-                        
-                    except Exception as e:
-                        error_msg = f"Error writing file {translated_file.path}: {str(e)}"
-                        error_with_stacktrace(error_msg, e)
-                        console.print(f"[red]❌ {error_msg}[/red]")
                 
                 self.translation_stats["files_written"] = written_files
                 self.translation_stats["end_time"] = time.time()
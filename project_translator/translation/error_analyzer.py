@@ -9,7 +9,7 @@ import re
 import subprocess
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,6 +28,7 @@ class ErrorType(Enum):
     DEPENDENCY_ERROR = "dependency_error"
     SYNTAX_ERROR = "syntax_error"
     CONFIGURATION_ERROR = "configuration_error"
+    SETUP_ERROR = "setup_error"
     UNKNOWN_ERROR = "unknown_error"
 
 
@@ -46,6 +47,84 @@ class ErrorInfo:
             self.suggestions = []
 
 
+# Error pattern mappings, compiled once at import time
+_ERROR_PATTERNS = {
+    ErrorType.BUILD_ERROR: [
+        re.compile(r"build failed"),
+        re.compile(r"docker build.*failed"),
+        re.compile(r"dockerfile.*error"),
+        re.compile(r"build.*error"),
+        re.compile(r"failed to build")
+    ],
+    ErrorType.COMPILE_ERROR: [
+        re.compile(r"compilation.*error"),
+        re.compile(r"syntax.*error"),
+        re.compile(r"parse.*error"),
+        re.compile(r"compiler.*error"),
+        re.compile(r"javac.*error"),
+        re.compile(r"gcc.*error"),
+        re.compile(r"g\+\+.*error")
+    ],
+    ErrorType.RUNTIME_ERROR: [
+        re.compile(r"runtime.*error"),
+        re.compile(r"exception.*thrown"),
+        re.compile(r"segmentation.*fault"),
+        re.compile(r"null.*pointer"),
+        re.compile(r"index.*out.*of.*bounds"),
+        re.compile(r"connection.*refused"),
+        re.compile(r"port.*already.*in.*use")
+    ],
+    ErrorType.DEPENDENCY_ERROR: [
+        re.compile(r"package.*not.*found"),
+        re.compile(r"module.*not.*found"),
+        re.compile(r"import.*error"),
+        re.compile(r"dependency.*missing"),
+        re.compile(r"npm.*error"),
+        re.compile(r"pip.*error"),
+        re.compile(r"maven.*error")
+    ],
+    ErrorType.SYNTAX_ERROR: [
+        re.compile(r"syntax.*error"),
+        re.compile(r"unexpected.*token"),
+        re.compile(r"missing.*semicolon"),
+        re.compile(r"unclosed.*bracket"),
+        re.compile(r"invalid.*syntax")
+    ],
+    ErrorType.CONFIGURATION_ERROR: [
+        re.compile(r"config.*error"),
+        re.compile(r"configuration.*invalid"),
+        re.compile(r"missing.*config"),
+        re.compile(r"invalid.*setting")
+    ]
+}
+
+# One alternation per error type, so classifying an error output takes a
+# single scan per type instead of one per pattern. Type order is kept.
+_ERROR_TYPE_SCANNERS = {
+    error_type: re.compile("|".join(f"(?:{pattern.pattern})" for pattern in patterns))
+    for error_type, patterns in _ERROR_PATTERNS.items()
+}
+
+# Keywords that select fix suggestions, each set scanned in a single pass
+# instead of one substring search per keyword
+_BUILD_HINT_RE = re.compile(r"dockerfile|permission|no such file|port")
+_RUNTIME_HINT_RE = re.compile(r"connection refused|port already in use|null pointer|out of memory")
+_TEST_HINT_RE = re.compile(r"status|timeout|connection")
+
+
+def _find_keywords(pattern: re.Pattern, text: str) -> Set[str]:
+    """Get the set of keywords of an alternation pattern found in text."""
+    return {match.group(0) for match in pattern.finditer(text)}
+
+
+# Common patterns for file:line errors
+_FILE_LINE_PATTERNS = (
+    re.compile(r"([^:\s]+):(\d+):"),
+    re.compile(r"([^:\s]+)\((\d+)\):"),
+    re.compile(r"at\s+([^:\s]+):(\d+)")
+)
+
+
 class ErrorAnalyzer:
     """Analyzes errors and provides suggestions for fixes."""
     
@@ -54,55 +133,7 @@ class ErrorAnalyzer:
         self.logger = get_logger("error_analyzer")
         
         # Error pattern mappings
-        self.error_patterns = {
-            ErrorType.BUILD_ERROR: [
-                r"build failed",
-                r"docker build.*failed",
-                r"dockerfile.*error",
-                r"build.*error",
-                r"failed to build"
-            ],
-            ErrorType.COMPILE_ERROR: [
-                r"compilation.*error",
-                r"syntax.*error",
-                r"parse.*error",
-                r"compiler.*error",
-                r"javac.*error",
-                r"gcc.*error",
-                r"g\+\+.*error"
-            ],
-            ErrorType.RUNTIME_ERROR: [
-                r"runtime.*error",
-                r"exception.*thrown",
-                r"segmentation.*fault",
-                r"null.*pointer",
-                r"index.*out.*of.*bounds",
-                r"connection.*refused",
-                r"port.*already.*in.*use"
-            ],
-            ErrorType.DEPENDENCY_ERROR: [
-                r"package.*not.*found",
-                r"module.*not.*found",
-                r"import.*error",
-                r"dependency.*missing",
-                r"npm.*error",
-                r"pip.*error",
-                r"maven.*error"
-            ],
-            ErrorType.SYNTAX_ERROR: [
-                r"syntax.*error",
-                r"unexpected.*token",
-                r"missing.*semicolon",
-                r"unclosed.*bracket",
-                r"invalid.*syntax"
-            ],
-            ErrorType.CONFIGURATION_ERROR: [
-                r"config.*error",
-                r"configuration.*invalid",
-                r"missing.*config",
-                r"invalid.*setting"
-            ]
-        }
+        self.error_patterns = _ERROR_PATTERNS
     
     def analyze_build_error(self, error_output: str, project_path: str) -> ErrorInfo:
         """
@@ -116,22 +147,23 @@ class ErrorAnalyzer:
             ErrorInfo object with analysis
         """
         suggestions = []
+        keywords = _find_keywords(_BUILD_HINT_RE, error_output.lower())
         
         # Check for common Docker build issues
-        if "dockerfile" in error_output.lower():
+        if "dockerfile" in keywords:
             suggestions.extend([
                 "Check Dockerfile syntax and base image",
                 "Ensure all required files are copied correctly",
                 "Verify build context includes all necessary files"
             ])
         
-        if "permission" in error_output.lower():
+        if "permission" in keywords:
             suggestions.append("Check file permissions and ownership")
         
-        if "no such file" in error_output.lower():
+        if "no such file" in keywords:
             suggestions.append("Verify all referenced files exist in the build context")
         
-        if "port" in error_output.lower():
+        if "port" in keywords:
             suggestions.append("Check port configuration and availability")
         
         return ErrorInfo(
@@ -158,34 +190,28 @@ class ErrorAnalyzer:
         file_path = None
         line_number = None
         
-        # Common patterns for file:line errors
-        file_line_patterns = [
-            r"([^:\s]+):(\d+):",
-            r"([^:\s]+)\((\d+)\):",
-            r"at\s+([^:\s]+):(\d+)"
-        ]
-        
-        for pattern in file_line_patterns:
-            match = re.search(pattern, error_output)
+        for pattern in _FILE_LINE_PATTERNS:
+            match = pattern.search(error_output)
             if match:
                 file_path = match.group(1)
                 line_number = int(match.group(2))
                 break
         
         # Language-specific suggestions
-        if "java" in error_output.lower() or "javac" in error_output.lower():
+        error_output_lower = error_output.lower()
+        if "java" in error_output_lower or "javac" in error_output_lower:
             suggestions.extend([
                 "Check Java syntax and imports",
                 "Verify classpath and dependencies",
                 "Ensure proper package declarations"
             ])
-        elif "javascript" in error_output.lower() or "node" in error_output.lower():
+        elif "javascript" in error_output_lower or "node" in error_output_lower:
             suggestions.extend([
                 "Check JavaScript syntax",
                 "Verify module imports and exports",
                 "Check for missing semicolons or brackets"
             ])
-        elif "python" in error_output.lower():
+        elif "python" in error_output_lower:
             suggestions.extend([
                 "Check Python syntax and indentation",
                 "Verify import statements",
@@ -213,26 +239,27 @@ class ErrorAnalyzer:
             ErrorInfo object with analysis
         """
         suggestions = []
+        keywords = _find_keywords(_RUNTIME_HINT_RE, error_output.lower())
         
-        if "connection refused" in error_output.lower():
+        if "connection refused" in keywords:
             suggestions.extend([
                 "Check if the service is running on the correct port",
                 "Verify network configuration",
                 "Check firewall settings"
             ])
-        elif "port already in use" in error_output.lower():
+        elif "port already in use" in keywords:
             suggestions.extend([
                 "Change the port number in configuration",
                 "Stop other services using the same port",
                 "Check for zombie processes"
             ])
-        elif "null pointer" in error_output.lower():
+        elif "null pointer" in keywords:
             suggestions.extend([
                 "Check for null value handling",
                 "Add null checks before object access",
                 "Verify object initialization"
             ])
-        elif "out of memory" in error_output.lower():
+        elif "out of memory" in keywords:
             suggestions.extend([
                 "Increase memory allocation",
                 "Check for memory leaks",
@@ -272,12 +299,12 @@ class ErrorAnalyzer:
                             
                             suggestions = []
                             if "error" in step:
-                                error_msg = step["error"]
-                                if "status" in error_msg.lower():
+                                keywords = _find_keywords(_TEST_HINT_RE, step["error"].lower())
+                                if "status" in keywords:
                                     suggestions.append("Check HTTP status code handling")
-                                if "timeout" in error_msg.lower():
+                                if "timeout" in keywords:
                                     suggestions.append("Increase timeout or check service responsiveness")
-                                if "connection" in error_msg.lower():
+                                if "connection" in keywords:
                                     suggestions.append("Verify service connectivity and configuration")
                             
                             errors.append(ErrorInfo(
@@ -302,8 +329,6 @@ class ErrorAnalyzer:
         Returns:
             ErrorInfo object with analysis
         """
-        error_output_lower = error_output.lower()
-        
         # If we have a hint, use the appropriate analyzer
         if error_type_hint == ErrorType.BUILD_ERROR:
             return self.analyze_build_error(error_output, project_path)
@@ -312,23 +337,24 @@ class ErrorAnalyzer:
         elif error_type_hint == ErrorType.RUNTIME_ERROR:
             return self.analyze_runtime_error(error_output, project_path)
         
-        # Otherwise, try to determine the error type
-        for error_type, patterns in self.error_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, error_output_lower):
-                    if error_type == ErrorType.BUILD_ERROR:
-                        return self.analyze_build_error(error_output, project_path)
-                    elif error_type == ErrorType.COMPILE_ERROR:
-                        return self.analyze_compile_error(error_output, project_path)
-                    elif error_type == ErrorType.RUNTIME_ERROR:
-                        return self.analyze_runtime_error(error_output, project_path)
-                    else:
-                        return ErrorInfo(
-                            error_type=error_type,
-                            message=f"Error detected: {error_type.value}",
-                            context=error_output,
-                            suggestions=[f"Investigate {error_type.value.replace('_', ' ')}"]
-                        )
+        # Otherwise, try to determine the error type; the output is only
+        # lowercased here, hinted errors never need it
+        error_output_lower = error_output.lower()
+        for error_type, scanner in _ERROR_TYPE_SCANNERS.items():
+            if scanner.search(error_output_lower):
+                if error_type == ErrorType.BUILD_ERROR:
+                    return self.analyze_build_error(error_output, project_path)
+                elif error_type == ErrorType.COMPILE_ERROR:
+                    return self.analyze_compile_error(error_output, project_path)
+                elif error_type == ErrorType.RUNTIME_ERROR:
+                    return self.analyze_runtime_error(error_output, project_path)
+                else:
+                    return ErrorInfo(
+                        error_type=error_type,
+                        message=f"Error detected: {error_type.value}",
+                        context=error_output,
+                        suggestions=[f"Investigate {error_type.value.replace('_', ' ')}"]
+                    )
         
         # Default to unknown error
         return ErrorInfo(
@@ -5,18 +5,31 @@ This module implements the Anthropic API provider for LLM communication
 during project translation using Claude models.
 """
 
-from typing import List, Dict, Any, Optional
-from rich.console import Console
+from typing import List, Dict, Any, Optional, Iterator
 import json
 
 from project_translator.translation.protocols.mcp import MCPMessage, MCPMessageType
-from project_translator.translation.protocols.mcp import FunctionCallContent
+from project_translator.translation.protocols.mcp import FunctionCallContent, parse_tool_arguments
 from project_translator.translation.llm_providers.base import BaseLLMProvider, LLMResponse, UsageData
-from project_translator.utils import get_logger, error_with_stacktrace
+from project_translator.utils import get_logger, error_with_stacktrace, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("anthropic_provider")
 
+# Limits and descriptions of known models
+_MODEL_INFO = {
+    "claude-opus-4-20250514": {
+        "max_tokens": 200000,
+        "context_window": 200000,
+        "description": "Claude Opus 4.0 - Most capable model with advanced reasoning"
+    }
+}
+
+# Descriptions shown when listing models
+_MODEL_DESCRIPTIONS = {
+    "claude-opus-4-20250514": "Claude Opus 4.0 - Most capable model with advanced reasoning"
+}
+
 
 class AnthropicProvider(BaseLLMProvider):
     """Anthropic API provider implementation."""
@@ -113,8 +126,7 @@ class AnthropicProvider(BaseLLMProvider):
             Dictionary of parsed arguments
         """
         try:
-            import json
-            return json.loads(arguments)
+            return parse_tool_arguments(arguments)
         except (json.JSONDecodeError, TypeError):
             logger.warning(f"Failed to parse arguments: {arguments}")
             return {}
@@ -142,44 +154,104 @@ class AnthropicProvider(BaseLLMProvider):
         
         return anthropic_tools
     
-    def send_message(self, messages: List[MCPMessage], 
-                    tools: Optional[List[Dict[str, Any]]] = None) -> LLMResponse:
+    def _build_request_params(self, messages: List[MCPMessage],
+                              tools: Optional[List[Dict[str, Any]]] = None,
+                              max_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
-        Send messages to Anthropic API using streaming.
+        Build Anthropic request parameters from MCP messages.
         
         Args:
             messages: List of messages in the conversation
             tools: List of available tools for the LLM
+            max_tokens: Output token limit (self.max_tokens if None)
             
         Returns:
-            LLMResponse object with the model's response
+            Dictionary of request parameters
+        """
+        # Convert messages to Anthropic format
+        anthropic_messages, system_message = self._convert_messages_to_anthropic_format(messages)
+        
+        # Prepare request parameters
+        request_params = {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "temperature": self.temperature,
+            "messages": anthropic_messages
+        }
+        
+        # Add system message if present, marked as a cacheable prefix so
+        # the unchanged system prompt (and tools) are served from the prompt cache
+        if system_message:
+            request_params["system"] = [{
+                "type": "text",
+                "text": system_message,
+                "cache_control": {"type": "ephemeral"}
+            }]
+        
+        # Add tools if provided
+        if tools:
+            anthropic_tools = self._convert_anthropic_tools(tools)
+            request_params["tools"] = anthropic_tools
+        
+        return request_params
+    
+    def stream_text(self, messages: List[MCPMessage]) -> Iterator[str]:
+        """
+        Send messages to Anthropic API and yield text deltas as they arrive.
+        
+        Args:
+            messages: List of messages in the conversation
+            
+        Yields:
+            Chunks of assistant response text
         """
         try:
             if not self.validate_configuration():
                 raise ValueError("Invalid Anthropic configuration")
             
-            # Convert messages to Anthropic format
-            anthropic_messages, system_message = self._convert_messages_to_anthropic_format(messages)
+            request_params = self._build_request_params(messages)
+            
+            if not self.client:
+                raise ValueError("Anthropic client not initialized. API key may be missing.")
+            
+            logger.info(f"Streaming request to Anthropic {self.model} with {len(messages)} messages")
+            
+            with self.client.messages.stream(**request_params) as stream:
+                for text in stream.text_stream:
+                    yield text
             
-            # Prepare request parameters
-            request_params = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": anthropic_messages
-            }
+        except Exception as e:
+            error_msg = f"Error streaming message from Anthropic: {str(e)}"
+            error_with_stacktrace(error_msg, e)
+            console.print(f"[red]Anthropic API Error: {error_msg}[/red]")
+            raise
+    
+    def send_message(self, messages: List[MCPMessage], 
+                    tools: Optional[List[Dict[str, Any]]] = None,
+                    max_tokens: Optional[int] = None,
+                    timeout: Optional[float] = None) -> LLMResponse:
+        """
+        Send messages to Anthropic API using streaming.
+        
+        Args:
+            messages: List of messages in the conversation
+            tools: List of available tools for the LLM
+            max_tokens: Output token limit for this call (provider default if None)
+            timeout: Request timeout in seconds for this call (client default if None)
             
-            # Add system message if present
-            if system_message:
-                request_params["system"] = system_message
+        Returns:
+            LLMResponse object with the model's response
+        """
+        try:
+            if not self.validate_configuration():
+                raise ValueError("Invalid Anthropic configuration")
             
-            # Add tools if provided
-            if tools:
-                anthropic_tools = self._convert_anthropic_tools(tools)
-                request_params["tools"] = anthropic_tools
+            request_params = self._build_request_params(messages, tools, max_tokens)
+            if timeout is not None:
+                request_params["timeout"] = timeout
             
             logger.info(f"Sending streaming request to Anthropic {self.model} with {len(messages)} messages")
-            logger.debug(f"Request parameters: {request_params}")
+            logger.debug("Request parameters: %s", request_params)
             
             # Make streaming API call
             if not self.client:
@@ -199,10 +271,10 @@ class AnthropicProvider(BaseLLMProvider):
                     # Handle different chunk types
                     if chunk.type == "message_start":
                         response_id = chunk.message.id
-                        logger.debug(f"Started streaming message: {response_id}")
+                        logger.debug("Started streaming message: %s", response_id)
                         
                     elif chunk.type == "content_block_start":
-                        logger.debug(f"Started content block: {chunk.content_block.type}")
+                        logger.debug("Started content block: %s", chunk.content_block.type)
                         
                     elif chunk.type == "content_block_delta":
                         # Accumulate text content
@@ -211,7 +283,7 @@ class AnthropicProvider(BaseLLMProvider):
                                 "type": "text",
                                 "text": chunk.delta.text
                             })
-                            logger.debug(f"Received text delta: {len(chunk.delta.text)} chars")
+                            logger.debug("Received text delta: %d chars", len(chunk.delta.text))
                             
                     elif chunk.type == "content_block_stop":
                         logger.debug("Content block completed")
@@ -220,7 +292,7 @@ class AnthropicProvider(BaseLLMProvider):
                         # Handle usage information
                         if hasattr(chunk.delta, 'usage') and chunk.delta.usage:
                             accumulated_usage = chunk.delta.usage
-                            logger.debug(f"Received usage delta: {chunk.delta.usage}")
+                            logger.debug("Received usage delta: %s", chunk.delta.usage)
                             
                     elif chunk.type == "message_stop":
                         logger.debug("Message streaming completed")
@@ -276,8 +348,9 @@ class AnthropicProvider(BaseLLMProvider):
             
             response = MockResponse(mock_content, accumulated_usage, response_id)
             
-            logger.info(f"Received complete streaming response from Anthropic: {len(response.model_dump_json())} chars")
-            logger.debug(f"Response: {response.model_dump_json()}")
+            response_json = response.model_dump_json()
+            logger.info("Received complete streaming response from Anthropic: %d chars", len(response_json))
+            logger.debug("Response: %s", response_json)
             
             # Convert response to MCP messages
             response_messages = []
@@ -338,11 +411,7 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             Description of the model
         """
-        model_descriptions = {
-            "claude-opus-4-20250514": "Claude Opus 4.0 - Most capable model with advanced reasoning"
-        }
-        
-        return model_descriptions.get(model_name, f"Anthropic {model_name} model")
+        return _MODEL_DESCRIPTIONS.get(model_name, f"Anthropic {model_name} model")
     
     def validate_configuration(self) -> bool:
         """
@@ -377,16 +446,10 @@ class AnthropicProvider(BaseLLMProvider):
         Returns:
             Dictionary with model information
         """
-        model_info = {
-            "claude-opus-4-20250514": {
-                "max_tokens": 200000,
-                "context_window": 200000,
-                "description": "Claude Opus 4.0 - Most capable model with advanced reasoning"
-            }
-        }
-        
-        return model_info.get(self.model, {
+        if self.model in _MODEL_INFO:
+            return dict(_MODEL_INFO[self.model])
+        return {
             "max_tokens": self.max_tokens,
             "context_window": "Unknown",
             "description": f"Custom model: {self.model}"
-        })
+        }
@@ -6,16 +6,16 @@ project translation.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from dataclasses import dataclass
 
-from project_translator.translation.protocols.mcp import MCPMessage
+from project_translator.translation.protocols.mcp import MCPMessage, MCPMessageType
 from project_translator.utils import get_logger
 
 logger = get_logger("llm_provider")
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageData:
     """Represents usage data."""
     input_tokens: int
@@ -23,7 +23,7 @@ class UsageData:
     total_tokens: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Represents an LLM response."""
     messages: List[MCPMessage]
@@ -51,19 +51,41 @@ class BaseLLMProvider(ABC):
     
     @abstractmethod
     def send_message(self, messages: List[MCPMessage], 
-                    tools: Optional[List[Dict[str, Any]]] = None) -> LLMResponse:
+                    tools: Optional[List[Dict[str, Any]]] = None,
+                    max_tokens: Optional[int] = None,
+                    timeout: Optional[float] = None) -> LLMResponse:
         """
         Send messages to the LLM and get response.
         
         Args:
             messages: List of messages in the conversation
             tools: List of available tools for the LLM
+            max_tokens: Output token limit for this call (provider default if None)
+            timeout: Request timeout in seconds for this call (client default if None)
             
         Returns:
             LLMResponse object with the model's response
         """
         pass
     
+    def stream_text(self, messages: List[MCPMessage]) -> Iterator[str]:
+        """
+        Send messages to the LLM and yield the response text as it arrives.
+        
+        Providers without native streaming support fall back to yielding
+        the assistant text of a regular send_message call.
+        
+        Args:
+            messages: List of messages in the conversation
+            
+        Yields:
+            Chunks of assistant response text
+        """
+        response = self.send_message(messages)
+        for message in response.messages:
+            if message.role == MCPMessageType.ASSISTANT:
+                yield str(message.content)
+    
     @abstractmethod
     def get_available_models(self) -> List[str]:
         """
@@ -13,16 +13,64 @@ from openai.types.responses.response_output_item import ResponseOutputItem
 from openai.types.responses.response_output_message import ResponseOutputMessage
 from openai.types.responses.response_function_tool_call import ResponseFunctionToolCall
 from openai.types.responses.response_output_text import ResponseOutputText
-from rich.console import Console
 
 from project_translator.translation.protocols.mcp import MCPMessage, MCPMessageType
 from project_translator.translation.protocols.mcp import FunctionCallContent
 from project_translator.translation.llm_providers.base import BaseLLMProvider, LLMResponse, UsageData
-from project_translator.utils import get_logger, error_with_stacktrace
+from project_translator.utils import get_logger, error_with_stacktrace, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("openai_provider")
 
+# Limits and descriptions of known models
+_MODEL_INFO = {
+    "gpt-4": {
+        "max_tokens": 8192,
+        "context_window": 128000,
+        "description": "Most capable GPT-4 model"
+    },
+    "gpt-4-turbo": {
+        "max_tokens": 4096,
+        "context_window": 128000,
+        "description": "Faster GPT-4 model"
+    },
+    "gpt-4-32k": {
+        "max_tokens": 32768,
+        "context_window": 32768,
+        "description": "GPT-4 with 32k context window"
+    },
+    "gpt-3.5-turbo": {
+        "max_tokens": 4096,
+        "context_window": 16384,
+        "description": "Fast and efficient GPT-3.5 model"
+    },
+    "gpt-3.5-turbo-16k": {
+        "max_tokens": 16384,
+        "context_window": 16384,
+        "description": "GPT-3.5 with 16k context window"
+    }
+}
+
+# Descriptions shown when listing models
+_MODEL_DESCRIPTIONS = {
+    "gpt-4": "Most capable GPT-4 model",
+    "gpt-4-turbo": "Faster GPT-4 model with vision support",
+    "gpt-4-32k": "GPT-4 with 32k context window",
+    "gpt-4o": "Latest GPT-4 model with improved capabilities",
+    "gpt-4o-mini": "Efficient GPT-4 model",
+    "gpt-3.5-turbo": "Fast and efficient GPT-3.5 model",
+    "gpt-3.5-turbo-16k": "GPT-3.5 with 16k context window"
+}
+
+# OpenAI pricing (as of 2024, in USD per 1K tokens)
+_PRICING = {
+    "gpt-4": {"input": 0.03, "output": 0.06},
+    "gpt-4-turbo": {"input": 0.01, "output": 0.03},
+    "gpt-4-32k": {"input": 0.06, "output": 0.12},
+    "gpt-3.5-turbo": {"input": 0.001, "output": 0.002},
+    "gpt-3.5-turbo-16k": {"input": 0.003, "output": 0.004}
+}
+
 
 class OpenAIProvider(BaseLLMProvider):
     """OpenAI API provider implementation."""
@@ -83,13 +131,17 @@ class OpenAIProvider(BaseLLMProvider):
         return input_parts
     
     def send_message(self, messages: List[MCPMessage], 
-                    tools: Optional[List[Dict[str, Any]]] = None) -> List[MCPMessage]:
+                    tools: Optional[List[Dict[str, Any]]] = None,
+                    max_tokens: Optional[int] = None,
+                    timeout: Optional[float] = None) -> List[MCPMessage]:
         """
         Send messages to OpenAI API using the Responses API.
         
         Args:
             messages: List of messages in the conversation
             tools: List of available tools for the LLM
+            max_tokens: Output token limit for this call (provider default if None)
+            timeout: Request timeout in seconds for this call (client default if None)
             
         Returns:
             List of messages with the model's response
@@ -105,7 +157,7 @@ class OpenAIProvider(BaseLLMProvider):
             request_params = {
                 "model": self.model,
                 "input": input_text,
-                "max_output_tokens": self.max_tokens,
+                "max_output_tokens": max_tokens or self.max_tokens,
                 "temperature": self.temperature,
                 "stream": False
             }
@@ -115,8 +167,11 @@ class OpenAIProvider(BaseLLMProvider):
                 request_params["tools"] = tools
                 request_params["tool_choice"] = "auto"
             
+            if timeout is not None:
+                request_params["timeout"] = timeout
+            
             logger.info(f"Sending request to OpenAI {self.model} with {len(messages)} messages")
-            logger.debug(f"Request parameters: {request_params}")
+            logger.debug("Request parameters: %s", request_params)
             
             # Make API call using Responses API
             if not self.client:
@@ -126,8 +181,9 @@ class OpenAIProvider(BaseLLMProvider):
 
             self.raw_responses.append(response.to_dict())
             
-            logger.info(f"Received response from OpenAI: {len(response.model_dump_json(indent=2))} chars")
-            logger.debug(f"Response: {response.model_dump_json(indent=2)}")
+            response_json = response.model_dump_json(indent=2)
+            logger.info("Received response from OpenAI: %d chars", len(response_json))
+            logger.debug("Response: %s", response_json)
             
             # Extract response data from Responses API format
             response_messages = []
@@ -189,17 +245,7 @@ class OpenAIProvider(BaseLLMProvider):
             return model_info.get("description", f"OpenAI {model_name} model")
         
         # Get description for other models
-        model_descriptions = {
-            "gpt-4": "Most capable GPT-4 model",
-            "gpt-4-turbo": "Faster GPT-4 model with vision support",
-            "gpt-4-32k": "GPT-4 with 32k context window",
-            "gpt-4o": "Latest GPT-4 model with improved capabilities",
-            "gpt-4o-mini": "Efficient GPT-4 model",
-            "gpt-3.5-turbo": "Fast and efficient GPT-3.5 model",
-            "gpt-3.5-turbo-16k": "GPT-3.5 with 16k context window"
-        }
-        
-        return model_descriptions.get(model_name, f"OpenAI {model_name} model")
+        return _MODEL_DESCRIPTIONS.get(model_name, f"OpenAI {model_name} model")
     
     def validate_configuration(self) -> bool:
         """
@@ -234,39 +280,13 @@ class OpenAIProvider(BaseLLMProvider):
         Returns:
             Dictionary with model information
         """
-        model_info = {
-            "gpt-4": {
-                "max_tokens": 8192,
-                "context_window": 128000,
-                "description": "Most capable GPT-4 model"
-            },
-            "gpt-4-turbo": {
-                "max_tokens": 4096,
-                "context_window": 128000,
-                "description": "Faster GPT-4 model"
-            },
-            "gpt-4-32k": {
-                "max_tokens": 32768,
-                "context_window": 32768,
-                "description": "GPT-4 with 32k context window"
-            },
-            "gpt-3.5-turbo": {
-                "max_tokens": 4096,
-                "context_window": 16384,
-                "description": "Fast and efficient GPT-3.5 model"
-            },
-            "gpt-3.5-turbo-16k": {
-                "max_tokens": 16384,
-                "context_window": 16384,
-                "description": "GPT-3.5 with 16k context window"
-            }
-        }
-        
-        return model_info.get(self.model, {
+        if self.model in _MODEL_INFO:
+            return dict(_MODEL_INFO[self.model])
+        return {
             "max_tokens": self.max_tokens,
             "context_window": "Unknown",
             "description": f"Custom model: {self.model}"
-        })
+        }
     
     def estimate_cost(self, prompt_tokens: int, completion_tokens: int) -> Dict[str, float]:
         """
@@ -279,16 +299,7 @@ class OpenAIProvider(BaseLLMProvider):
         Returns:
             Dictionary with cost estimates
         """
-        # OpenAI pricing (as of 2024, in USD per 1K tokens)
-        pricing = {
-            "gpt-4": {"input": 0.03, "output": 0.06},
-            "gpt-4-turbo": {"input": 0.01, "output": 0.03},
-            "gpt-4-32k": {"input": 0.06, "output": 0.12},
-            "gpt-3.5-turbo": {"input": 0.001, "output": 0.002},
-            "gpt-3.5-turbo-16k": {"input": 0.003, "output": 0.004}
-        }
-        
-        model_pricing = pricing.get(self.model, {"input": 0.01, "output": 0.02})
+        model_pricing = _PRICING.get(self.model, {"input": 0.01, "output": 0.02})
         
         input_cost = (prompt_tokens / 1000) * model_pricing["input"]
         output_cost = (completion_tokens / 1000) * model_pricing["output"]
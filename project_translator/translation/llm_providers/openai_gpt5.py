@@ -13,16 +13,28 @@ from openai.types.responses.response_output_item import ResponseOutputItem
 from openai.types.responses.response_output_message import ResponseOutputMessage
 from openai.types.responses.response_function_tool_call import ResponseFunctionToolCall
 from openai.types.responses.response_output_text import ResponseOutputText
-from rich.console import Console
 
 from project_translator.translation.protocols.mcp import MCPMessage, MCPMessageType
 from project_translator.translation.protocols.mcp import FunctionCallContent
 from project_translator.translation.llm_providers.base import BaseLLMProvider, LLMResponse, UsageData
-from project_translator.utils import get_logger, error_with_stacktrace
+from project_translator.utils import get_logger, error_with_stacktrace, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("openai_provider")
 
+# Limits and descriptions of known models
+_MODEL_INFO = {
+    "gpt-5": {
+        "context_window": 1280000,
+        "description": "Most capable GPT-5 model"
+    }
+}
+
+# Descriptions shown when listing models
+_MODEL_DESCRIPTIONS = {
+    "gpt-5": "Most capable GPT-5 model",
+}
+
 
 class OpenAIGPT5Provider(BaseLLMProvider):
     """OpenAI API provider implementation."""
@@ -81,13 +93,17 @@ class OpenAIGPT5Provider(BaseLLMProvider):
         return input_parts
     
     def send_message(self, messages: List[MCPMessage], 
-                    tools: Optional[List[Dict[str, Any]]] = None) -> List[MCPMessage]:
+                    tools: Optional[List[Dict[str, Any]]] = None,
+                    max_tokens: Optional[int] = None,
+                    timeout: Optional[float] = None) -> List[MCPMessage]:
         """
         Send messages to OpenAI API using the Responses API.
         
         Args:
             messages: List of messages in the conversation
             tools: List of available tools for the LLM
+            max_tokens: Output token limit for this call (provider default if None)
+            timeout: Request timeout in seconds for this call (client default if None)
             
         Returns:
             List of messages with the model's response
@@ -111,8 +127,14 @@ class OpenAIGPT5Provider(BaseLLMProvider):
                 request_params["tools"] = tools
                 request_params["tool_choice"] = "auto"
             
+            # Output is unbounded by default; apply per-call limits if given
+            if max_tokens is not None:
+                request_params["max_output_tokens"] = max_tokens
+            if timeout is not None:
+                request_params["timeout"] = timeout
+            
             logger.info(f"Sending request to OpenAI {self.model} with {len(messages)} messages")
-            logger.debug(f"Request parameters: {request_params}")
+            logger.debug("Request parameters: %s", request_params)
             
             # Make API call using Responses API
             if not self.client:
@@ -122,8 +144,9 @@ class OpenAIGPT5Provider(BaseLLMProvider):
 
             self.raw_responses.append(response.to_dict())
             
-            logger.info(f"Received response from OpenAI: {len(response.model_dump_json(indent=2))} chars")
-            logger.debug(f"Response: {response.model_dump_json(indent=2)}")
+            response_json = response.model_dump_json(indent=2)
+            logger.info("Received response from OpenAI: %d chars", len(response_json))
+            logger.debug("Response: %s", response_json)
             
             # Extract response data from Responses API format
             response_messages = []
@@ -183,11 +206,7 @@ class OpenAIGPT5Provider(BaseLLMProvider):
             return model_info.get("description", f"OpenAI {model_name} model")
         
         # Get description for other models
-        model_descriptions = {
-            "gpt-5": "Most capable GPT-5 model",
-        }
-        
-        return model_descriptions.get(model_name, f"OpenAI {model_name} model")
+        return _MODEL_DESCRIPTIONS.get(model_name, f"OpenAI {model_name} model")
     
     def validate_configuration(self) -> bool:
         """
@@ -222,17 +241,12 @@ class OpenAIGPT5Provider(BaseLLMProvider):
         Returns:
             Dictionary with model information
         """
-        model_info = {
-            "gpt-5": {
-                "context_window": 1280000,
-                "description": "Most capable GPT-5 model"
-            }
-        }
-        
-        return model_info.get(self.model, {
+        if self.model in _MODEL_INFO:
+            return dict(_MODEL_INFO[self.model])
+        return {
             "context_window": self.context_window,
             "description": f"Custom model: {self.model}"
-        })
+        }
 
     
     def _convert_openai_output_message_to_mcp_message(self, output_item: ResponseOutputMessage) -> MCPMessage:
@@ -9,15 +9,14 @@ import json
 import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 
-from .protocols.mcp import MCPProtocol, MCPMessage, MCPMessageType
+from .protocols.mcp import MCPProtocol, MCPMessage, MCPMessageType, parse_tool_arguments
 from .llm_providers.base import BaseLLMProvider, LLMResponse
 from .tools.file_operations import FileOperationsTool
-from project_translator.utils import get_logger, error_with_stacktrace
+from project_translator.utils import get_logger, error_with_stacktrace, get_console
 
-console = Console()
+console = get_console()
 logger = get_logger("mcp_translator")
 
 
@@ -233,7 +232,7 @@ class MCPProjectTranslator:
                 self.translation_stats["tool_calls"] += 1
                 
                 tool_name = tool_call.content.name
-                arguments = json.loads(tool_call.content.arguments)
+                arguments = parse_tool_arguments(tool_call.content.arguments)
                 
                 logger.info(f"Processing tool call: {tool_name} with args: {arguments}")
                 
@@ -242,6 +241,10 @@ class MCPProjectTranslator:
                     result = file_ops.get_file(arguments["file_path"])
                     self.translation_stats["files_read"] += 1
                     
+                elif tool_name == "get_files":
+                    result = file_ops.get_files(arguments["file_paths"])
+                    self.translation_stats["files_read"] += len(arguments["file_paths"])
+                    
                 elif tool_name == "write_file":
                     result = file_ops.write_file(
                         arguments["file_path"], 
@@ -265,11 +268,7 @@ class MCPProjectTranslator:
                     }
                 
                 # Format result for LLM
-                tool_call_result = MCPMessage(
-                    role=MCPMessageType.FUNCTION_RESPONSE,
-                    content=str(result),
-                    id=tool_call.id
-                )
+                tool_call_result = self.mcp_protocol.format_tool_response(tool_call.id, result)
                 results.append(tool_call_result)
                 
             except Exception as e:
@@ -390,7 +389,7 @@ class MCPProjectTranslator:
         try:
             conversation_data = {
                 "translation_summary": self.get_translation_summary(),
-                "conversation_history": list(map(lambda x: x.to_dict(), self.mcp_protocol.get_conversation_history())),
+                "conversation_history": self.mcp_protocol.get_conversation_history_dicts(),
                 "raw_responses": self.llm_provider.get_raw_responses(),
                 "mcp_protocol": {
                     "available_tools": self.mcp_protocol.get_available_tools()
@@ -6,17 +6,38 @@ project in one request to reduce token usage and improve efficiency.
 """
 
 import json
+import logging
+import os
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-from pathlib import Path
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-from project_translator.utils import get_logger
+from project_translator.utils import get_logger, json_loads
 
 logger = get_logger("batch_protocol")
 
+# Directories that never contain translatable sources
+_EXCLUDE_DIRS = frozenset({
+    '__pycache__', '.git', 'node_modules', '.venv', 'venv',
+    'target', 'build', 'dist', '.pytest_cache', '.coverage',
+    '.tox', '.mypy_cache', 'logs', 'tmp', 'temp'
+})
 
-@dataclass
+# Threads used to scan project directories when collecting source files
+_COLLECT_WORKERS = 8
+
+# Markers used to extract file entries from the (possibly malformed) JSON
+# returned by the LLM. Content may be delimited by backticks or quotes.
+_CONTENT_START_RE = re.compile(r'"content":\s*(`|")')
+_CONTENT_END_RE = re.compile(r'(`|")\s*,\s*"original_path"')
+_PATH_RE = re.compile(r'"path":\s*"([^"]+)"')
+_SUMMARY_RE = re.compile(r'"translation_summary":\s*"([^"]+)"')
+_WARNINGS_RE = re.compile(r'"warnings":\s*\["([^"]+)"\]')
+
+
+@dataclass(slots=True)
 class ProjectFile:
     """Represents a project file with its content."""
     path: str
@@ -32,7 +53,7 @@ class ProjectFile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslatedFile:
     """Represents a translated file."""
     path: str
@@ -46,7 +67,7 @@ class TranslatedFile:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTranslationRequest:
     """Represents a batch translation request."""
     source_language: str
@@ -64,7 +85,7 @@ class BatchTranslationRequest:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchTranslationResponse:
     """Represents a batch translation response."""
     translated_files: List[TranslatedFile]
@@ -80,12 +101,229 @@ class BatchTranslationResponse:
         }
 
 
+# Characters that matter to _find_json_object_end outside and inside strings
+_JSON_STRUCTURE_RE = re.compile(r'[{}"]')
+_JSON_STRING_SPECIAL_RE = re.compile(r'["\\]')
+
+
+def _find_json_object_end(text: str, start: int) -> int:
+    """
+    Find the brace that closes the JSON object opening at text[start].
+    
+    Braces inside double-quoted strings (including escaped quotes) are
+    ignored, so nested objects are matched correctly in a single pass.
+    The scan jumps between significant characters with precompiled
+    regexes, so runs of ordinary text (such as file contents) are
+    skipped at C speed rather than examined one character at a time.
+    
+    Args:
+        text: Text containing the object
+        start: Index of the opening brace
+        
+    Returns:
+        Index of the matching closing brace, or -1 if the object is unterminated
+    """
+    structure_search = _JSON_STRUCTURE_RE.search
+    string_search = _JSON_STRING_SPECIAL_RE.search
+    depth = 0
+    pos = start
+    
+    while True:
+        match = structure_search(text, pos)
+        if match is None:
+            return -1
+        
+        i = match.start()
+        char = text[i]
+        if char == '{':
+            depth += 1
+            pos = i + 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+            pos = i + 1
+        else:
+            # Skip over the string, stepping past escaped characters
+            pos = i + 1
+            while True:
+                match = string_search(text, pos)
+                if match is None:
+                    return -1
+                i = match.start()
+                if text[i] == '"':
+                    pos = i + 1
+                    break
+                pos = i + 2
+
+
+def _file_suffix(name: str) -> str:
+    """Return the suffix of a file name with the same rules as Path.suffix."""
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ''
+
+
+# Batch instructions template; rendered with str.format in _build_translation_instructions
+_TRANSLATION_INSTRUCTIONS_TEMPLATE = """You are an expert project translator. Your task is to translate a project from {source_lang} to {target_lang} while maintaining exact functionality.
+
+CRITICAL REQUIREMENTS:
+1. The translated project must be a Docker containerized REST API
+2. The API behavior must be EXACTLY the same as the original
+3. The Dockerfile must use port 8000
+4. All functionalities must be preserved
+5. The project structure should be adapted to {target_lang} conventions
+6. The project must be able to be built and run with Docker without any other tools
+
+RESPONSE FORMAT:
+You must respond with a JSON object containing:
+{{
+    "translated_files": [
+        {{
+            "path": "relative/path/to/file",
+            "content": "file content here",
+            "original_path": "original/path/to/file"
+        }}
+    ],
+    "translation_summary": "Brief summary of what was translated",
+    "warnings": ["any warnings or notes about the translation"]
+}}
+
+TRANSLATION GUIDELINES:
+1. Translate all source code files to {target_lang}
+2. Update dependency files (requirements.txt, package.json, etc.) for {target_lang}
+3. Update Dockerfile to use appropriate {target_lang} base image
+4. Maintain the same API endpoints and behavior
+5. Preserve all configuration settings
+6. Update documentation if present
+7. Ensure the project can be built and run with Docker
+8. If the target language needs to be compiled, consider using a multi-stage build Dockerfile
+
+IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or explanations."""
+
+
+@lru_cache(maxsize=64)
+def _build_translation_instructions(source_lang: str, target_lang: str) -> str:
+    """Build the batch translation instructions for a language pair."""
+    return _TRANSLATION_INSTRUCTIONS_TEMPLATE.format(
+        source_lang=source_lang,
+        target_lang=target_lang
+    )
+
+
+# Slice size used when running a complete response through the streaming parser
+_STREAM_PARSE_SLICE = 64 * 1024
+
+
+class StreamingTranslationParser:
+    """
+    Incrementally extracts translated files from a streamed LLM response.
+    
+    Chunks are fed as they arrive; every file whose closing marker has been
+    received is returned right away and dropped from the buffer, so only the
+    file currently being streamed is held in memory.
+    """
+    
+    # Longest marker that can straddle two chunks
+    _MARKER_OVERLAP = len('`, "original_path"') + 16
+    
+    def __init__(self, protocol: "BatchTranslationProtocol"):
+        """
+        Initialize the streaming parser.
+        
+        Args:
+            protocol: Protocol used to post-process file content
+        """
+        self.protocol = protocol
+        self.translation_summary = ""
+        self.warnings: List[str] = []
+        self.files_parsed = 0
+        self._chunks: List[str] = []
+        self._tail = ""
+    
+    def feed(self, chunk: str) -> List[TranslatedFile]:
+        """
+        Feed a chunk of response text.
+        
+        Args:
+            chunk: Next piece of the LLM response
+            
+        Returns:
+            List of files completed by this chunk
+        """
+        if not chunk:
+            return []
+        
+        self._chunks.append(chunk)
+        window = self._tail + chunk
+        self._tail = window[-self._MARKER_OVERLAP:]
+        
+        # Only rescan the buffer once a file end marker may have arrived
+        if "original_path" not in window:
+            return []
+        
+        return self._drain()
+    
+    def _drain(self) -> List[TranslatedFile]:
+        """Extract every complete file entry currently in the buffer."""
+        buffer = "".join(self._chunks)
+        completed = []
+        
+        while True:
+            path_match = _PATH_RE.search(buffer)
+            if not path_match:
+                break
+            start_match = _CONTENT_START_RE.search(buffer, path_match.end())
+            if not start_match:
+                break
+            end_match = _CONTENT_END_RE.search(buffer, start_match.end())
+            if not end_match:
+                break
+            
+            content = buffer[start_match.end():end_match.start()]
+            completed.append(TranslatedFile(
+                path=path_match.group(1),
+                content=self.protocol.process_file_content(content)
+            ))
+            buffer = buffer[end_match.end():]
+        
+        self._chunks = [buffer]
+        self.files_parsed += len(completed)
+        return completed
+    
+    def close(self) -> List[TranslatedFile]:
+        """
+        Finish parsing and extract the summary and warnings.
+        
+        Returns:
+            List of any files completed by the remaining buffer
+        """
+        completed = self._drain()
+        remainder = "".join(self._chunks)
+        self._chunks = []
+        
+        summary_match = _SUMMARY_RE.search(remainder)
+        if summary_match:
+            self.translation_summary = summary_match.group(1)
+        
+        warnings_match = _WARNINGS_RE.search(remainder)
+        if warnings_match:
+            self.warnings = [warnings_match.group(1)]
+        
+        return completed
+
+
 class BatchTranslationProtocol:
     """Batch translation protocol for efficient project translation."""
     
     def __init__(self):
         """Initialize batch translation protocol."""
         self.logger = get_logger("batch_protocol")
+        # Decoded source files keyed by path, stored with the (mtime_ns, size)
+        # they were read at, so collecting an unchanged project again skips
+        # reading and decoding its files
+        self._file_content_cache: Dict[str, Tuple[int, int, str]] = {}
     
     def create_translation_request(self, source_path: str, source_lang: str, 
                                  target_lang: str) -> BatchTranslationRequest:
@@ -131,47 +369,91 @@ class BatchTranslationProtocol:
         Returns:
             List of ProjectFile objects
         """
-        source_dir = Path(source_path)
         project_files = []
         
-        # Directories to exclude
-        exclude_dirs = {
-            '__pycache__', '.git', 'node_modules', '.venv', 'venv',
-            'target', 'build', 'dist', '.pytest_cache', '.coverage',
-            'logs', 'tmp', 'temp'
-        }
+        # Walk level by level; the directories of a level are scanned and
+        # their files read concurrently, since the walk mostly waits on I/O
+        level = [(os.fspath(source_path), "")]
         
-        for file_path in source_dir.rglob('*'):
-            # Skip directories
-            if file_path.is_dir():
-                continue
+        with ThreadPoolExecutor(max_workers=_COLLECT_WORKERS) as executor:
+            while level:
+                if len(level) == 1:
+                    results = [self._scan_project_directory(*level[0])]
+                else:
+                    results = executor.map(lambda item: self._scan_project_directory(*item), level)
+                
+                level = []
+                for directory_files, subdirectories in results:
+                    project_files.extend(directory_files)
+                    level.extend(subdirectories)
+        
+        self.logger.info(f"Collected {len(project_files)} project files")
+        return project_files
+    
+    def _scan_project_directory(self, dir_path: str, relative_dir: str
+                                ) -> Tuple[List[ProjectFile], List[Tuple[str, str]]]:
+        """
+        Read the files of a single project directory.
+        
+        Args:
+            dir_path: Path of the directory to scan
+            relative_dir: Directory path relative to the project root
             
-            # Skip excluded directories
-            if any(part in exclude_dirs for part in file_path.parts):
-                continue
+        Returns:
+            Tuple of the directory's project files and the (path, relative path)
+            pairs of its subdirectories that are not excluded
+        """
+        project_files = []
+        subdirectories = []
+        
+        # Walk with scandir so excluded subtrees are pruned at descent time
+        # instead of being listed and filtered file by file
+        try:
+            with os.scandir(dir_path) as entries:
+                entries = list(entries)
+        except OSError as e:
+            self.logger.warning(f"Could not read directory {dir_path}: {str(e)}")
+            return project_files, subdirectories
+        
+        for entry in entries:
+            relative_path = os.path.join(relative_dir, entry.name) if relative_dir else entry.name
             
             try:
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXCLUDE_DIRS:
+                        subdirectories.append((entry.path, relative_path))
+                    continue
+                
+                if not entry.is_file():
+                    continue
                 
-                # Get relative path
-                relative_path = str(file_path.relative_to(source_dir))
+                stat = entry.stat()
+                cached = self._file_content_cache.get(entry.path)
+                if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    content = cached[2]
+                else:
+                    # Read raw bytes and decode once; this skips the text-mode
+                    # incremental decoder, so newlines are normalized here the
+                    # way universal newline mode would
+                    with open(entry.path, 'rb') as f:
+                        content = f.read().decode('utf-8')
+                    if '\r' in content:
+                        content = content.replace('\r\n', '\n').replace('\r', '\n')
+                    self._file_content_cache[entry.path] = (stat.st_mtime_ns, stat.st_size, content)
                 
                 project_file = ProjectFile(
                     path=relative_path,
                     content=content,
-                    file_type=file_path.suffix
+                    file_type=_file_suffix(entry.name)
                 )
                 
                 project_files.append(project_file)
                 
             except Exception as e:
-                self.logger.warning(f"Could not read file {file_path}: {str(e)}")
+                self.logger.warning(f"Could not read file {entry.path}: {str(e)}")
                 continue
         
-        self.logger.info(f"Collected {len(project_files)} project files")
-        return project_files
+        return project_files, subdirectories
     
     def _create_translation_instructions(self, source_lang: str, target_lang: str, 
                                        ) -> str:
@@ -185,43 +467,7 @@ class BatchTranslationProtocol:
         Returns:
             Translation instructions string
         """
-        instructions = f"""You are an expert project translator. Your task is to translate a project from {source_lang} to {target_lang} while maintaining exact functionality.
-
-CRITICAL REQUIREMENTS:
-1. The translated project must be a Docker containerized REST API
-2. The API behavior must be EXACTLY the same as the original
-3. The Dockerfile must use port 8000
-4. All functionalities must be preserved
-5. The project structure should be adapted to {target_lang} conventions
-6. The project must be able to be built and run with Docker without any other tools
-
-RESPONSE FORMAT:
-You must respond with a JSON object containing:
-{{
-    "translated_files": [
-        {{
-            "path": "relative/path/to/file",
-            "content": "file content here",
-            "original_path": "original/path/to/file"
-        }}
-    ],
-    "translation_summary": "Brief summary of what was translated",
-    "warnings": ["any warnings or notes about the translation"]
-}}
-
-TRANSLATION GUIDELINES:
-1. Translate all source code files to {target_lang}
-2. Update dependency files (requirements.txt, package.json, etc.) for {target_lang}
-3. Update Dockerfile to use appropriate {target_lang} base image
-4. Maintain the same API endpoints and behavior
-5. Preserve all configuration settings
-6. Update documentation if present
-7. Ensure the project can be built and run with Docker
-8. If the target language needs to be compiled, consider using a multi-stage build Dockerfile
-
-IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or explanations."""
-        
-        return instructions
+        return _build_translation_instructions(source_lang, target_lang)
     
     def parse_translation_response(self, response_text: str) -> BatchTranslationResponse:
         """
@@ -241,8 +487,12 @@ IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or e
             if json_start == -1 or json_end == 0:
                 raise ValueError("No JSON object found in response")
             
-            json_text = response_text[json_start:json_end]
-            response_data = self.parse_malformed_json(json_text)
+            # Well-formed JSON is decoded directly; anything else (e.g. backtick
+            # delimited content) goes through the malformed JSON parser. The
+            # bounds are handed to that parser so the body is never copied.
+            response_data = self._parse_strict_json(response_text, json_start)
+            if response_data is None:
+                response_data = self.parse_malformed_json(response_text, json_start, json_end)
             
             # Parse translated files
             translated_files = []
@@ -267,16 +517,111 @@ IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or e
             self.logger.error(f"Error parsing translation response: {str(e)}")
             raise ValueError(f"Failed to parse translation response: {str(e)}")
     
-    def parse_malformed_json(self, json_string: str) -> Dict[str, Any]:
+    def parse_translation_response_stream(self, response_text: str,
+                                          parser: Optional[StreamingTranslationParser] = None
+                                          ) -> Iterator[TranslatedFile]:
+        """
+        Parse the LLM response, yielding translated files one at a time.
+        
+        Well-formed JSON is decoded as in parse_translation_response(). Other
+        responses are fed through a StreamingTranslationParser in slices, so
+        each file can be written and released before the next is extracted.
+        The summary, warnings and file count are left on the parser.
+        A response without any translated file raises ValueError, as a reply
+        without a JSON object does.
+        
+        Args:
+            response_text: Raw response text from LLM
+            parser: Parser that collects the summary and warnings
+                    (a new one is used if None)
+            
+        Yields:
+            TranslatedFile objects in response order
+        """
+        if parser is None:
+            parser = self.create_stream_parser()
+        
+        json_start = response_text.find('{')
+        if json_start == -1:
+            raise ValueError("No JSON object found in response")
+        
+        response_data = self._parse_strict_json(response_text, json_start)
+        if response_data is not None:
+            parser.translation_summary = response_data.get('translation_summary', '')
+            parser.warnings = response_data.get('warnings', [])
+            for file_data in response_data['translated_files']:
+                parser.files_parsed += 1
+                yield TranslatedFile(path=file_data['path'], content=file_data['content'])
+        else:
+            for offset in range(json_start, len(response_text), _STREAM_PARSE_SLICE):
+                yield from parser.feed(response_text[offset:offset + _STREAM_PARSE_SLICE])
+            yield from parser.close()
+        
+        if parser.files_parsed == 0:
+            raise ValueError("No translated files found in response")
+    
+    def _parse_strict_json(self, response_text: str, json_start: int) -> Optional[Dict[str, Any]]:
+        """
+        Decode the response as standard JSON if it is well formed.
+        
+        Args:
+            response_text: Raw response text from LLM
+            json_start: Index of the first opening brace
+            
+        Returns:
+            Decoded response data, or None if the response is not valid JSON
+            in the expected shape
+        """
+        json_end = _find_json_object_end(response_text, json_start)
+        if json_end == -1:
+            return None
+        
+        try:
+            response_data = json_loads(response_text[json_start:json_end + 1])
+        except ValueError:
+            return None
+        
+        if not isinstance(response_data, dict):
+            return None
+        
+        translated_files = response_data.get('translated_files')
+        if not isinstance(translated_files, list):
+            return None
+        
+        for file_data in translated_files:
+            if not (isinstance(file_data, dict)
+                    and isinstance(file_data.get('path'), str)
+                    and isinstance(file_data.get('content'), str)):
+                return None
+        
+        return response_data
+    
+    def create_stream_parser(self) -> StreamingTranslationParser:
+        """
+        Create a parser for incrementally consuming a streamed response.
+        
+        Returns:
+            StreamingTranslationParser bound to this protocol
+        """
+        return StreamingTranslationParser(self)
+    
+    def parse_malformed_json(self, json_string: str, start: int = 0,
+                             end: Optional[int] = None) -> Dict[str, Any]:
         """
         Parse the malformed JSON by extracting fields manually.
         
         The JSON string contains backticks instead of proper JSON quotes for content fields.
         We need to find the exact boundaries: "content": `...content...`
         This approach correctly handles backticks within the content itself.
+        
+        Only json_string[start:end] is scanned; the bounds are applied by the
+        regex engine so the input is not copied.
         """
+        if end is None:
+            end = len(json_string)
 
-        logger.debug(f"Parsing malformed JSON: {json_string}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parsing malformed JSON: %s", json_string[start:end])
         result = {}
         
         # Extract translated_files array
@@ -287,23 +632,19 @@ IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or e
         # We'll use a more robust approach by finding the start and end markers
         
         # Find all "content": ` patterns
-        content_start_pattern = r'"content":\s*(`|")'
-        content_starts = [m.start() for m in re.finditer(content_start_pattern, json_string)]
+        content_starts = [m.end() for m in _CONTENT_START_RE.finditer(json_string, start, end)]
         
         # Find all ` patterns  
-        content_end_pattern = r'(`|")\s*,\s*"original_path"'
-        content_ends = [m.start() for m in re.finditer(content_end_pattern, json_string)]
+        content_ends = [m.start() for m in _CONTENT_END_RE.finditer(json_string, start, end)]
         
         # Find all path pairs
-        path_pattern = r'"path":\s*"([^"]+)"'
-        
-        paths = re.findall(path_pattern, json_string)
+        paths = _PATH_RE.findall(json_string, start, end)
         
         # Extract content between the markers
         matches = []
         for i, path in enumerate(paths):
             if i < len(content_starts) and i < len(content_ends):
-                start_pos = content_starts[i] + len(re.search(content_start_pattern, json_string[content_starts[i]:]).group())
+                start_pos = content_starts[i]
                 end_pos = content_ends[i]
                 content = json_string[start_pos:end_pos]
                 matches.append((path, content))
@@ -319,14 +660,12 @@ IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or e
         result["translated_files"] = translated_files
         
         # Extract translation_summary
-        summary_pattern = r'"translation_summary":\s*"([^"]+)"'
-        summary_match = re.search(summary_pattern, json_string)
+        summary_match = _SUMMARY_RE.search(json_string, start, end)
         if summary_match:
             result["translation_summary"] = summary_match.group(1)
         
         # Extract warnings array
-        warnings_pattern = r'"warnings":\s*\["([^"]+)"\]'
-        warnings_match = re.search(warnings_pattern, json_string)
+        warnings_match = _WARNINGS_RE.search(json_string, start, end)
         if warnings_match:
             result["warnings"] = [warnings_match.group(1)]
         
@@ -346,15 +685,27 @@ IMPORTANT: Respond ONLY with the JSON object. Do not include any other text or e
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
+        return list(self.iter_validation_errors(response))
+    
+    def iter_validation_errors(self, response: BatchTranslationResponse) -> Iterator[str]:
+        """
+        Lazily yield validation errors for the translation response.
+        
+        Callers that only need to know whether the response is valid can
+        stop at the first error.
         
+        Args:
+            response: BatchTranslationResponse to validate
+            
+        Yields:
+            Validation error messages
+        """
         if not response.translated_files:
-            errors.append("No translated files provided")
+            yield "No translated files provided"
+            return
         
         for i, file in enumerate(response.translated_files):
             if not file.path:
-                errors.append(f"File {i}: Missing file path")
+                yield f"File {i}: Missing file path"
             if not file.content:
-                errors.append(f"File {i}: Missing file content")
-        
-        return errors
+                yield f"File {i}: Missing file content"
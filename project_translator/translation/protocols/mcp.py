@@ -5,11 +5,17 @@ This module implements the MCP protocol for structured communication
 with LLM providers during project translation.
 """
 
+import ast
+import hashlib
 import json
-from dataclasses import dataclass
-from typing import List, Dict, Any
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
+from ...utils import json_dumps, json_loads
+
 
 class MCPMessageType(str, Enum):
     """Types of MCP messages."""
@@ -20,13 +26,18 @@ class MCPMessageType(str, Enum):
     FUNCTION_RESPONSE = "function_response"
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCallContent:
     """Represents a function call content."""
     name: str
     arguments: str
     call_id: str
 
+    def __post_init__(self):
+        # Tool names come from a small fixed set; interning lets every
+        # call share one string object
+        self.name = sys.intern(self.name)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert function call content to dictionary format."""
         return {
@@ -36,15 +47,31 @@ class FunctionCallContent:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MCPMessage:
-    """Represents an MCP message."""
+    """
+    Represents an MCP message.
+    
+    Messages are frozen, which allows the dictionary form to be built
+    once and reused; to_dict() returns a copy so callers cannot alter it.
+    """
     role: MCPMessageType
     content: Any
     id: str
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary format."""
+        result = dict(self._as_dict())
+        if isinstance(self.content, FunctionCallContent):
+            result["content"] = dict(result["content"])
+        return result
+    
+    def _as_dict(self) -> Dict[str, Any]:
+        """Get the cached dictionary form, building it on first use; must not be modified."""
+        if self._cached_dict is not None:
+            return self._cached_dict
+        
         result = {
             "role": self.role.value,
             "id": self.id
@@ -55,111 +82,172 @@ class MCPMessage:
         else:
             result["content"] = self.content
         
+        # The instance is frozen; the cache slot is filled in directly
+        object.__setattr__(self, "_cached_dict", result)
         return result
 
 
-class MCPProtocol:
-    """Model Context Protocol implementation for project translation."""
+def parse_tool_arguments(arguments: str) -> Any:
+    """
+    Parse the JSON arguments of a tool call.
     
-    def __init__(self):
-        """Initialize MCP protocol."""
-        self.conversation_history: List[MCPMessage] = []
-        self.available_tools = [
-            {
-                "type": "function",
-                "name": "get_file",
-                "description": "Get the content of a file",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path to the file to read"
-                        }
-                    },
-                    "required": ["file_path"],
-                    "additionalProperties": False
-                },
-                "strict": True
+    Well-formed JSON takes the fast path. Payloads with common LLM mistakes
+    are recovered instead of dropping the tool call: json5, when installed,
+    accepts trailing commas, single quotes and unquoted keys; the Python
+    literal parse used otherwise only accepts trailing commas and single
+    quotes.
+    
+    Args:
+        arguments: Tool call arguments as a JSON string
+        
+    Returns:
+        Parsed arguments
+        
+    Raises:
+        json.JSONDecodeError: If the arguments cannot be recovered
+    """
+    try:
+        return json_loads(arguments)
+    except json.JSONDecodeError as e:
+        error = e
+    
+    try:
+        import json5
+    except ImportError:
+        json5 = None
+    
+    if json5 is not None:
+        try:
+            return json5.loads(arguments)
+        except ValueError:
+            pass
+    
+    try:
+        return ast.literal_eval(arguments)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        # TypeError covers unhashable keys such as {[1]: 2}
+        raise error from None
+
+
+# Tool schemas offered to the LLM. They are static, so one shared tuple is
+# used by every protocol instance; callers must not modify it.
+_AVAILABLE_TOOLS: Tuple[Dict[str, Any], ...] = (
+    {
+        "type": "function",
+        "name": "get_file",
+        "description": "Get the content of a file",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path to the file to read"
+                }
             },
-            {
-                "type": "function",
-                "name": "write_file", 
-                "description": "Write content to a file",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {
-                            "type": "string",
-                            "description": "Path where to write the file"
-                        },
-                        "content": {
-                            "type": "string",
-                            "description": "Content to write to the file"
-                        }
-                    },
-                    "required": ["file_path", "content"],
-                    "additionalProperties": False
-                },
-                "strict": True
+            "required": ["file_path"],
+            "additionalProperties": False
+        },
+        "strict": True
+    },
+    {
+        "type": "function",
+        "name": "get_files",
+        "description": "Get the contents of several files at once",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_paths": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Paths of the files to read"
+                }
             },
-            {
-                "type": "function",
-                "name": "list_directory",
-                "description": "List contents of a directory",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "directory_path": {
-                            "type": "string",
-                            "description": "Path to the directory to list"
-                        }
-                    },
-                    "required": ["directory_path"],
-                    "additionalProperties": False
+            "required": ["file_paths"],
+            "additionalProperties": False
+        },
+        "strict": True
+    },
+    {
+        "type": "function",
+        "name": "write_file", 
+        "description": "Write content to a file",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "file_path": {
+                    "type": "string",
+                    "description": "Path where to write the file"
                 },
-                "strict": True
+                "content": {
+                    "type": "string",
+                    "description": "Content to write to the file"
+                }
             },
-            {
-                "type": "function",
-                "name": "ask_question",
-                "description": "Ask a clarifying question",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "question": {
-                            "type": "string",
-                            "description": "The question to ask"
-                        }
-                    },
-                    "required": ["question"],
-                    "additionalProperties": False
-                },
-                "strict": True
+            "required": ["file_path", "content"],
+            "additionalProperties": False
+        },
+        "strict": True
+    },
+    {
+        "type": "function",
+        "name": "list_directory",
+        "description": "List contents of a directory",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "directory_path": {
+                    "type": "string",
+                    "description": "Path to the directory to list"
+                }
             },
-            {
-                "type": "function",
-                "name": "translation_complete",
-                "description": "Mark the translation as complete",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "translation_summary": {
-                            "type": "string",
-                            "description": "The summary of the translation"
-                        }
-                    },
-                    "required": ["translation_summary"],
-                    "additionalProperties": False
-                },
-                "strict": True
-            }
-        ]
-    
-    def create_system_message(self, source_lang: str, target_lang: str, 
-                            project_type: str = "Docker containerized REST API") -> MCPMessage:
-        """Create the initial system message for translation."""
-        system_prompt = f"""You are an expert project translator. Your task is to translate a {project_type} project from {source_lang} to {target_lang} while maintaining exact functionality.
+            "required": ["directory_path"],
+            "additionalProperties": False
+        },
+        "strict": True
+    },
+    {
+        "type": "function",
+        "name": "ask_question",
+        "description": "Ask a clarifying question",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "question": {
+                    "type": "string",
+                    "description": "The question to ask"
+                }
+            },
+            "required": ["question"],
+            "additionalProperties": False
+        },
+        "strict": True
+    },
+    {
+        "type": "function",
+        "name": "translation_complete",
+        "description": "Mark the translation as complete",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "translation_summary": {
+                    "type": "string",
+                    "description": "The summary of the translation"
+                }
+            },
+            "required": ["translation_summary"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+)
+
+# Tool results at least this long are replaced by a reference when an
+# identical result was already sent earlier in the conversation
+_DEDUP_MIN_RESULT_SIZE = 1024
+
+
+# System prompt template; rendered with str.format in _build_system_prompt
+_SYSTEM_PROMPT_TEMPLATE = """You are an expert project translator. Your task is to translate a {project_type} project from {source_lang} to {target_lang} while maintaining exact functionality.
 
 IMPORTANT REQUIREMENTS:
 1. The translated project must be a Docker containerized REST API
@@ -171,6 +259,7 @@ IMPORTANT REQUIREMENTS:
 COMMUNICATION PROTOCOL:
 You can use the following tools to interact with the project:
 - get_file(file_path): Get the content of any file
+- get_files(file_paths): Get the contents of several files in one call
 - write_file(file_path, content): Write content to a file in the output directory
 - list_directory(directory_path): List contents of a directory
 - ask_question(question): Ask clarifying questions
@@ -179,7 +268,7 @@ You can use the following tools to interact with the project:
 TRANSLATION PROCESS:
 1. First, request the directory structure with list_directory("/")
 2. Analyze the project architecture and plan your translation strategy
-3. Request source files as needed with get_file()
+3. Request source files as needed with get_file(), or get_files() for several at once
 4. Translate files and write them with write_file()
 5. Ensure all dependencies and configurations are properly translated
 6. Verify the translation maintains the same API behavior
@@ -187,24 +276,111 @@ TRANSLATION PROCESS:
 
 Start by requesting the directory structure of the source project."""
 
+
+@lru_cache(maxsize=64)
+def _build_system_prompt(source_lang: str, target_lang: str, project_type: str) -> str:
+    """Build the translation system prompt for a language pair and project type."""
+    return _SYSTEM_PROMPT_TEMPLATE.format(
+        source_lang=source_lang,
+        target_lang=target_lang,
+        project_type=project_type
+    )
+
+
+class MCPProtocol:
+    """Model Context Protocol implementation for project translation."""
+    
+    def __init__(self):
+        """Initialize MCP protocol."""
+        self.conversation_history: List[MCPMessage] = []
+        self._history_dicts: List[Dict[str, Any]] = []
+        # Digest of large tool results -> id of the tool call that returned it
+        self._result_hash_cache: Dict[bytes, str] = {}
+    
+    def create_system_message(self, source_lang: str, target_lang: str, 
+                            project_type: str = "Docker containerized REST API") -> MCPMessage:
+        """Create the initial system message for translation."""
         return MCPMessage(
             role=MCPMessageType.SYSTEM,
-            content=system_prompt,
+            content=_build_system_prompt(source_lang, target_lang, project_type),
             id="system"
         )
     
     def add_message(self, message: MCPMessage) -> None:
-        """Add a message to the conversation history."""
+        """
+        Add a message to the conversation history.
+        
+        Messages are frozen, so their cached dictionary form stays valid.
+        """
+        message_dict = message._as_dict()
         self.conversation_history.append(message)
+        self._history_dicts.append(message_dict)
+    
+    def format_tool_response(self, tool_call_id: str, result: Any) -> MCPMessage:
+        """
+        Create the function response message for a tool call result.
+        
+        Text results are used as-is and UTF-8 bytes are decoded once, so
+        large payloads (e.g. file contents) are not copied through an
+        intermediate formatting step; dictionaries and lists are serialized
+        as JSON, and other results are rendered with str().
+        
+        A large result identical to one already returned in this
+        conversation (e.g. the same file read twice) is replaced by a short
+        reference to the earlier tool call.
+        
+        Args:
+            tool_call_id: Id of the tool call being answered
+            result: Result returned by the tool
+            
+        Returns:
+            MCPMessage with the FUNCTION_RESPONSE role
+        """
+        if isinstance(result, str):
+            content = result
+        elif isinstance(result, (bytes, bytearray, memoryview)):
+            content = str(result, "utf-8", "replace")
+        elif isinstance(result, (dict, list)):
+            try:
+                content = str(json_dumps(result), "utf-8")
+            except TypeError:
+                content = str(result)
+        else:
+            content = str(result)
+        
+        if len(content) >= _DEDUP_MIN_RESULT_SIZE:
+            digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+            prior_id = self._result_hash_cache.get(digest)
+            if prior_id is None:
+                self._result_hash_cache[digest] = tool_call_id
+            else:
+                content = f"Result identical to the response of tool call {prior_id}"
+        
+        return MCPMessage(
+            role=MCPMessageType.FUNCTION_RESPONSE,
+            content=content,
+            id=tool_call_id
+        )
     
     def get_conversation_history(self) -> List[MCPMessage]:
-        """Get the conversation history in dictionary format."""
+        """Get the conversation history as MCP messages (not copied)."""
         return self.conversation_history
     
-    def get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available tools."""
-        return self.available_tools
+    def get_conversation_history_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get the conversation history in dictionary format.
+        
+        The list is maintained as messages are added, so this is O(1).
+        Callers must not modify it.
+        """
+        return self._history_dicts
+    
+    def get_available_tools(self) -> Tuple[Dict[str, Any], ...]:
+        """Get the available tools (shared, must not be modified)."""
+        return _AVAILABLE_TOOLS
     
     def clear_history(self) -> None:
         """Clear the conversation history."""
         self.conversation_history.clear()
+        self._history_dicts.clear()
+        self._result_hash_cache.clear()
@@ -5,24 +5,73 @@ This module implements the retry mechanism that automatically tests translated
 projects and retries translation with error feedback when issues are detected.
 """
 
+import os
+import random
+import stat
 import time
-import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+from dataclasses import asdict, dataclass
 
 from .error_analyzer import ErrorAnalyzer, ErrorInfo, ErrorType
 from .test_executor import TestExecutor, TestExecutionResult
 from .llm_providers.base import BaseLLMProvider
-from .protocols.batch import BatchTranslationProtocol, BatchTranslationRequest, BatchTranslationResponse
+from .protocols.batch import BatchTranslationProtocol, BatchTranslationRequest, TranslatedFile
 from .protocols.mcp import MCPMessage, MCPMessageType
-from ..utils import get_logger
+from ..utils import get_logger, get_console, json_dumps, json_loads
 
-console = Console()
+console = get_console()
 logger = get_logger("retry_mechanism")
 
+# Markers of transient LLM API failures (rate limits, connection problems,
+# 5xx/overload), matched against exception class names and messages. Client
+# side timeouts are left out: repeating the call with the same timeout would
+# only wait as long again; server side timeouts arrive as 408/504
+_TRANSIENT_ERROR_MARKERS = (
+    "ratelimit", "rate limit", "rate_limit",
+    "connection", "internalserver", "serviceunavailable", "overloaded"
+)
+_TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504, 529})
+
+# Errors that another translation attempt cannot fix
+_NON_RETRYABLE_ERROR_TYPES = frozenset({ErrorType.SETUP_ERROR})
+_AUTH_ERROR_MARKERS = ("authentication", "permissiondenied", "permission denied",
+                       "invalid api key", "invalid x-api-key", "api key may be missing")
+_AUTH_STATUS_CODES = frozenset({401, 403})
+
+# Translated files are written by this many threads (the work is I/O bound
+# and a response holds a handful of files)
+_WRITE_WORKERS = 4
+
+# Persistent test result cache: only files up to this size are hashed, and
+# files in hidden and build output directories are not read; both still go
+# into the project tree hash by path, size and modification time
+_TEST_CACHE_MAX_FILE_SIZE = 1024 * 1024
+_TEST_CACHE_SKIP_DIRS = frozenset({"node_modules", "target", "build", "dist", "__pycache__", "venv"})
+# Files are fed to the test result cache hash in chunks of this size
+_TEST_CACHE_READ_CHUNK_SIZE = 64 * 1024
+
+
+def _is_transient_error(error: Exception) -> bool:
+    """Check whether an LLM API error is worth retrying after a delay."""
+    status_code = getattr(error, "status_code", None)
+    if status_code in _TRANSIENT_STATUS_CODES:
+        return True
+    
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def _is_auth_error(error: Exception) -> bool:
+    """Check whether an LLM API error is an authentication/authorization failure."""
+    if getattr(error, "status_code", None) in _AUTH_STATUS_CODES:
+        return True
+    
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _AUTH_ERROR_MARKERS)
+
 
 @dataclass
 class RetryAttempt:
@@ -38,7 +87,10 @@ class RetryMechanism:
     """Handles retry logic for batch translation with testing."""
     
     def __init__(self, llm_provider: BaseLLMProvider, source_lang: str, target_lang: str,
-                 max_retries: int = 3, test_cases_path: Optional[str] = None):
+                 max_retries: int = 3, test_cases_path: Optional[str] = None,
+                 cache_dir: Optional[str] = None,
+                 per_call_timeout: Optional[float] = None,
+                 max_output_tokens: Optional[int] = None):
         """
         Initialize the retry mechanism.
         
@@ -48,19 +100,49 @@ class RetryMechanism:
             target_lang: Target programming language
             max_retries: Maximum number of retry attempts
             test_cases_path: Path to test cases file (optional)
+            cache_dir: Directory for cached LLM responses and test results, e.g.
+                       ".cache/retry_translation" (optional, disabled if None);
+                       responses are only cached once their tests pass
+            per_call_timeout: Timeout in seconds for each LLM call (None for the
+                              client default)
+            max_output_tokens: Output token limit for each LLM call (None for the
+                               provider's configured limit)
         """
         self.llm_provider = llm_provider
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.max_retries = max_retries
         self.test_cases_path = test_cases_path
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.per_call_timeout = per_call_timeout
+        self.max_output_tokens = max_output_tokens
         
         self.batch_protocol = BatchTranslationProtocol()
         self.error_analyzer = ErrorAnalyzer()
         
         self.retry_attempts: List[RetryAttempt] = []
+        # Serialized form of each attempt, built once when it is recorded
+        self._attempt_dicts: List[Dict[str, Any]] = []
+        self._attempt_log_path: Optional[Path] = None
         
-        logger.info(f"RetryMechanism initialized: {source_lang} -> {target_lang}, max_retries={max_retries}")
+        # Source project request, collected once and reused by every attempt
+        self._source_request: Optional[BatchTranslationRequest] = None
+        # Formatted "--- FILE i: ..." blocks of the source files, keyed by
+        # (position, path); valid for the current source request only
+        self._formatted_blocks: Dict[Tuple[int, str], str] = {}
+        # SHA-256 of every file written to the output in this run, and test
+        # results keyed by the digest of that output state
+        self._output_digests: Dict[str, str] = {}
+        self._test_result_cache: Dict[str, TestExecutionResult] = {}
+        self._test_executor: Optional[TestExecutor] = None
+        # BLAKE2b digest of each hashed project file for the persistent test
+        # result cache, keyed by path and valid while (mtime_ns, size) match
+        self._file_hash_cache: Dict[str, Tuple[int, int, bytes]] = {}
+        # Response cache entry of the current attempt as (cache file, response
+        # text, read from the cache); it is only kept once the tests pass
+        self._attempt_response: Optional[Tuple[Path, str, bool]] = None
+        
+        logger.info("RetryMechanism initialized: %s -> %s, max_retries=%s", source_lang, target_lang, max_retries)
     
     def translate_with_retry(self, source_path: str, output_path: str,
                            save_conversation: bool = True,
@@ -90,8 +172,15 @@ class RetryMechanism:
             conversation_path = self._setup_conversation_saving(
                 conversation_dir, conversation_file, source_path, output_path
             )
+            self._attempt_log_path = Path(conversation_path).with_suffix('.jsonl')
+        else:
+            self._attempt_log_path = None
         
         # Initial translation attempt
+        self._source_request = None
+        self._formatted_blocks.clear()
+        self._output_digests.clear()
+        self._test_result_cache.clear()
         attempt = 0
         overall_success = False
         final_result = None
@@ -101,12 +190,13 @@ class RetryMechanism:
             console.print(f"\n[cyan]🔄 Attempt {attempt}/{self.max_retries + 1}[/cyan]")
             
             # Perform translation
+            self._attempt_response = None
             translation_result = self._perform_translation(source_path, output_path, attempt)
             
             if not translation_result.get("success", False):
                 # Translation itself failed
                 errors = [ErrorInfo(
-                    error_type=ErrorType.UNKNOWN_ERROR,
+                    error_type=ErrorType.SETUP_ERROR if translation_result.get("auth_error") else ErrorType.UNKNOWN_ERROR,
                     message="Translation failed",
                     context=translation_result.get("error", "Unknown error")
                 )]
@@ -117,14 +207,28 @@ class RetryMechanism:
                     errors=errors,
                     translation_result=translation_result
                 )
-                self.retry_attempts.append(retry_attempt)
+                self._record_attempt(retry_attempt)
                 
-                if attempt > self.max_retries:
+                if attempt > self.max_retries or self._has_non_retryable_errors(errors):
                     break
                 continue
             
-            # Test the translated project
-            test_result = self._test_translated_project(output_path)
+            # Test the translated project, unless this exact output was
+            # already tested in an earlier attempt. As in the persistent cache,
+            # only results where the service started are reused; build and
+            # startup failures can come from the environment and are rerun
+            output_digest = self._get_output_digest()
+            test_result = self._test_result_cache.get(output_digest)
+            if test_result is not None:
+                console.print("[yellow]⚠️  Output identical to an earlier attempt, reusing its test result[/yellow]")
+            else:
+                test_cache_file = self._get_test_cache_file(output_path)
+                test_result = self._load_cached_test_result(test_cache_file)
+                if test_result is None:
+                    test_result = self._test_translated_project(output_path)
+                    self._store_cached_test_result(test_cache_file, test_result)
+                if test_result.service_startup_success:
+                    self._test_result_cache[output_digest] = test_result
             
             # Analyze errors
             errors = self._analyze_test_result(test_result, output_path)
@@ -136,7 +240,8 @@ class RetryMechanism:
                 test_result=test_result,
                 translation_result=translation_result
             )
-            self.retry_attempts.append(retry_attempt)
+            self._record_attempt(retry_attempt)
+            self._settle_cached_response(test_result.success)
             
             if test_result.success:
                 console.print(f"[green]✅ Translation and testing successful on attempt {attempt}![/green]")
@@ -150,8 +255,11 @@ class RetryMechanism:
                     console.print(f"[red]❌ All {self.max_retries + 1} attempts failed[/red]")
                     break
                 
+                if self._has_non_retryable_errors(errors):
+                    break
+                
                 # Prepare for retry with error feedback
-                console.print(f"[blue]🔄 Preparing retry with error feedback...[/blue]")
+                console.print("[blue]🔄 Preparing retry with error feedback...[/blue]")
                 self._prepare_retry_with_feedback(errors, source_path)
         
         # Create final result
@@ -166,6 +274,62 @@ class RetryMechanism:
         
         return final_result
     
+    def _record_attempt(self, retry_attempt: RetryAttempt) -> None:
+        """
+        Record a completed attempt.
+        
+        When conversation saving is enabled, the attempt is also appended as
+        one line to the JSON Lines attempt log, so completed attempts survive
+        a crash in a later one.
+        
+        Args:
+            retry_attempt: Completed attempt
+        """
+        self.retry_attempts.append(retry_attempt)
+        attempt_dict = self._attempt_to_dict(retry_attempt)
+        self._attempt_dicts.append(attempt_dict)
+        
+        if self._attempt_log_path is not None:
+            try:
+                with open(self._attempt_log_path, 'ab') as f:
+                    f.write(json_dumps(attempt_dict) + b"\n")
+            except OSError as e:
+                logger.error("Error appending to attempt log: %s", e)
+    
+    @staticmethod
+    def _attempt_to_dict(attempt: RetryAttempt) -> Dict[str, Any]:
+        """
+        Convert a retry attempt to its saved dictionary form.
+        
+        Args:
+            attempt: Retry attempt
+            
+        Returns:
+            Dictionary with the attempt details
+        """
+        return {
+            "attempt": attempt.attempt_number,
+            "success": attempt.success,
+            "errors": [
+                {
+                    "type": error.error_type.value,
+                    "message": error.message,
+                    "file_path": error.file_path,
+                    "line_number": error.line_number,
+                    "context": error.context,
+                    "suggestions": error.suggestions
+                }
+                for error in attempt.errors
+            ],
+            "test_result": {
+                "success": attempt.test_result.success,
+                "build_success": attempt.test_result.build_success,
+                "service_startup_success": attempt.test_result.service_startup_success,
+                "test_success": attempt.test_result.test_success,
+                "execution_time": attempt.test_result.execution_time
+            } if attempt.test_result else None
+        }
+    
     def _perform_translation(self, source_path: str, output_path: str, 
                            attempt: int) -> Dict[str, Any]:
         """
@@ -182,10 +346,12 @@ class RetryMechanism:
         console.print(f"[blue]📝 Performing translation (attempt {attempt})...[/blue]")
         
         try:
-            # Create batch translation request
-            batch_request = self.batch_protocol.create_translation_request(
-                source_path, self.source_lang, self.target_lang
-            )
+            # Create batch translation request (the source project is read once)
+            if self._source_request is None:
+                self._source_request = self.batch_protocol.create_translation_request(
+                    source_path, self.source_lang, self.target_lang
+                )
+            batch_request = self._source_request
             
             # Add retry context if this is a retry
             if attempt > 1:
@@ -194,18 +360,19 @@ class RetryMechanism:
             # Send request to LLM
             response_text = self._send_batch_request(batch_request)
             
-            # Parse response
-            batch_response = self.batch_protocol.parse_translation_response(response_text)
-            
-            # Write translated files
-            written_files = self._write_translated_files(batch_response, output_path)
+            # Parse the response and write each file as soon as it is parsed
+            parser = self.batch_protocol.create_stream_parser()
+            translated_files = self.batch_protocol.parse_translation_response_stream(
+                response_text, parser
+            )
+            written_files = self._write_translated_files(translated_files, output_path)
             
             return {
                 "success": True,
                 "message": f"Translation completed on attempt {attempt}",
-                "translation_summary": batch_response.translation_summary,
-                "warnings": batch_response.warnings,
-                "files_translated": len(batch_response.translated_files),
+                "translation_summary": parser.translation_summary,
+                "warnings": parser.warnings,
+                "files_translated": parser.files_parsed,
                 "files_written": written_files,
                 "attempt": attempt
             }
@@ -216,9 +383,27 @@ class RetryMechanism:
             return {
                 "success": False,
                 "error": error_msg,
-                "attempt": attempt
+                "attempt": attempt,
+                "auth_error": _is_auth_error(e)
             }
     
+    def _has_non_retryable_errors(self, errors: List[ErrorInfo]) -> bool:
+        """
+        Check whether an attempt failed for a reason retrying cannot fix.
+        
+        Args:
+            errors: Errors from the attempt
+            
+        Returns:
+            True if further attempts should be skipped
+        """
+        non_retryable = [error for error in errors if error.error_type in _NON_RETRYABLE_ERROR_TYPES]
+        if not non_retryable:
+            return False
+        
+        logger.error("Non-retryable error: %s; aborting retries", non_retryable[0].context)
+        return True
+    
     def _add_retry_context(self, batch_request: BatchTranslationRequest, 
                           attempt: int) -> BatchTranslationRequest:
         """
@@ -274,6 +459,17 @@ Make sure to test your understanding of the errors before providing the translat
             # Format the request as a single message
             request_text = self._format_batch_request(batch_request)
             
+            # Reuse the response to an identical earlier request, if cached
+            cache_file = None
+            if self.cache_dir is not None:
+                cache_key = self._cache_key(batch_request, request_text)
+                cache_file = self.cache_dir / f"{cache_key}.txt"
+                if cache_file.is_file():
+                    logger.info("Using cached LLM response: %s", cache_file)
+                    response_text = cache_file.read_text(encoding='utf-8')
+                    self._attempt_response = (cache_file, response_text, True)
+                    return response_text
+            
             messages = [
                 MCPMessage(
                     role=MCPMessageType.SYSTEM,
@@ -287,13 +483,20 @@ Make sure to test your understanding of the errors before providing the translat
                 )
             ]
             
-            response = self.llm_provider.send_message(messages)
+            response = self._send_with_backoff(
+                messages,
+                max_tokens=self.max_output_tokens
+            )
             
             # Extract response text
-            response_text = ""
-            for message in response.messages:
-                if message.role == MCPMessageType.ASSISTANT:
-                    response_text += str(message.content)
+            response_text = "".join(
+                str(message.content) for message in response.messages
+                if message.role == MCPMessageType.ASSISTANT
+            )
+            
+            if cache_file is not None:
+                # Stored by _settle_cached_response once the tests pass
+                self._attempt_response = (cache_file, response_text, False)
             
             return response_text
                 
@@ -302,6 +505,104 @@ Make sure to test your understanding of the errors before providing the translat
             logger.error(error_msg)
             raise
     
+    def _send_with_backoff(self, messages: List[MCPMessage], max_retries: int = 5,
+                           base: float = 2.0, max_delay: float = 60.0,
+                           jitter_max: float = 1.0, max_tokens: Optional[int] = None):
+        """
+        Send messages to the LLM, retrying transient API failures.
+        
+        Transient errors (rate limits, connection and 5xx errors) are
+        retried with exponential backoff and jitter, so they do not
+        cost a full translate-and-test retry attempt. Other errors,
+        including client side timeouts, are raised immediately.
+        
+        Args:
+            messages: Messages to send
+            max_retries: Maximum number of retries after the first call
+            base: Base delay in seconds
+            max_delay: Maximum delay in seconds
+            jitter_max: Maximum random jitter added to each delay
+            max_tokens: Output token limit for the call
+            
+        Returns:
+            LLMResponse from the provider
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return self.llm_provider.send_message(
+                    messages,
+                    max_tokens=max_tokens,
+                    timeout=self.per_call_timeout
+                )
+            except Exception as e:
+                if attempt >= max_retries or not _is_transient_error(e):
+                    raise
+                
+                delay = min(base * 2 ** attempt + random.uniform(0, jitter_max), max_delay)
+                logger.warning("Transient LLM error: %s. Retrying in %.1fs (attempt %d/%d)",
+                               e, delay, attempt + 1, max_retries)
+                time.sleep(delay)
+    
+    def _cache_key(self, batch_request: BatchTranslationRequest, request_text: str) -> str:
+        """
+        Compute the response cache key for a batch request.
+        
+        The key covers the model, the instructions (which include any retry
+        feedback) and the formatted project files, so a request only hits
+        the cache when everything sent to the LLM is identical.
+        
+        Args:
+            batch_request: BatchTranslationRequest object
+            request_text: Formatted request text
+            
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for part in (self.llm_provider.model, batch_request.translation_instructions, request_text):
+            data = part.encode('utf-8')
+            digest.update(len(data).to_bytes(8, 'little'))
+            digest.update(data)
+        return digest.hexdigest()
+    
+    def _settle_cached_response(self, passed: bool) -> None:
+        """
+        Keep or discard the current attempt's response cache entry.
+        
+        Only responses whose translation passed its tests are cached, so a
+        rerun replays a working translation instead of a failing attempt
+        chain. A cached response that now fails is removed.
+        
+        Args:
+            passed: Whether the attempt's translation passed its tests
+        """
+        if self._attempt_response is None:
+            return
+        
+        cache_file, response_text, from_cache = self._attempt_response
+        self._attempt_response = None
+        if passed and not from_cache:
+            self._store_cached_response(cache_file, response_text)
+        elif not passed and from_cache:
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                logger.warning("Could not remove cached LLM response: %s", e)
+    
+    def _store_cached_response(self, cache_file: Path, response_text: str) -> None:
+        """
+        Store an LLM response in the response cache.
+        
+        Args:
+            cache_file: Cache file path
+            response_text: Response text from LLM
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(response_text, encoding='utf-8')
+        except OSError as e:
+            logger.warning("Could not cache LLM response: %s", e)
+    
     def _format_batch_request(self, batch_request: BatchTranslationRequest) -> str:
         """
         Format batch request for LLM.
@@ -312,48 +613,236 @@ Make sure to test your understanding of the errors before providing the translat
         Returns:
             Formatted request text
         """
-        formatted = f"Please translate this project from {batch_request.source_language} to {batch_request.target_language}:\n\n"
-        formatted += f"PROJECT FILES ({len(batch_request.project_files)} files):\n\n"
+        project_files = batch_request.project_files
+        parts = [
+            f"Please translate this project from {batch_request.source_language} to {batch_request.target_language}:\n\n",
+            f"PROJECT FILES ({len(project_files)} files):\n\n"
+        ]
         
-        for i, file_data in enumerate(batch_request.project_files, 1):
-            formatted += f"--- FILE {i}: {file_data.path} ({file_data.file_type}) ---\n"
-            formatted += file_data.content
-            formatted += "\n\n"
+        # Collect the pieces and join once instead of growing one string;
+        # file blocks are formatted once and reused by later attempts
+        formatted_blocks = self._formatted_blocks
+        for i, file_data in enumerate(project_files, 1):
+            block_key = (i, file_data.path)
+            block = formatted_blocks.get(block_key)
+            if block is None:
+                block = f"--- FILE {i}: {file_data.path} ({file_data.file_type}) ---\n{file_data.content}\n\n"
+                formatted_blocks[block_key] = block
+            parts.append(block)
         
-        return formatted
+        return "".join(parts)
     
-    def _write_translated_files(self, batch_response: BatchTranslationResponse, 
+    def _write_translated_files(self, translated_files: Iterable[TranslatedFile], 
                                output_path: str) -> int:
         """
         Write translated files to output directory.
         
+        Files are handed to a small thread pool as they are produced, so a
+        lazily parsed response is written while the rest is still being
+        parsed. A path that appears more than once is written in order, so
+        the last occurrence wins.
+        
         Args:
-            batch_response: Batch translation response
+            translated_files: Translated files, e.g. from parse_translation_response_stream()
             output_path: Output directory path
             
         Returns:
             Number of files written successfully
         """
+        output_root = Path(output_path)
+        created_dirs = set()
+        futures = {}
         written_files = 0
         
-        for translated_file in batch_response.translated_files:
-            try:
-                output_file_path = Path(output_path) / translated_file.path
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(output_file_path, 'w', encoding='utf-8') as f:
-                    f.write(translated_file.content)
+        with ThreadPoolExecutor(max_workers=_WRITE_WORKERS) as executor:
+            for translated_file in translated_files:
+                path = translated_file.path
+                target = output_root / path
                 
-                written_files += 1
-                console.print(f"[green]✅ Written: {output_file_path.relative_to(Path(output_path))}[/green]")
+                # Create each distinct parent directory once
+                parent = target.parent
+                if parent not in created_dirs:
+                    created_dirs.add(parent)
+                    try:
+                        parent.mkdir(parents=True, exist_ok=True)
+                    except OSError as e:
+                        # Reported per file when its write fails
+                        logger.error("Error creating directory %s: %s", parent, e)
                 
-            except Exception as e:
-                error_msg = f"Error writing file {translated_file.path}: {str(e)}"
-                logger.error(error_msg)
-                console.print(f"[red]❌ {error_msg}[/red]")
+                # A duplicate path waits for the earlier write, which the
+                # new one then replaces
+                previous = futures.pop(path, None)
+                if previous is not None:
+                    wait([previous])
+                futures[path] = executor.submit(self._write_file, target, translated_file.content)
+            
+            for path, future in futures.items():
+                try:
+                    self._output_digests[path] = future.result()
+                    written_files += 1
+                    console.print(f"[green]✅ Written: {path}[/green]")
+                except Exception as e:
+                    error_msg = f"Error writing file {path}: {str(e)}"
+                    logger.error(error_msg)
+                    console.print(f"[red]❌ {error_msg}[/red]")
         
         return written_files
     
+    @staticmethod
+    def _write_file(file_path: Path, content: str) -> str:
+        """
+        Write a single file (run on a worker thread).
+        
+        Args:
+            file_path: Destination path; its parent directory must exist
+            content: File content
+            
+        Returns:
+            Hex SHA-256 digest of the content
+        """
+        file_path.write_text(content, encoding='utf-8')
+        return hashlib.sha256(content.encode('utf-8')).hexdigest()
+    
+    def _get_output_digest(self) -> str:
+        """
+        Compute a digest of the translated output written so far in this run.
+        
+        Returns:
+            Hex SHA-256 digest over the sorted (path, content digest) pairs
+        """
+        digest = hashlib.sha256()
+        for path, file_digest in sorted(self._output_digests.items()):
+            digest.update(f"{path}:{file_digest}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _get_test_cache_file(self, output_path: str) -> Optional[Path]:
+        """
+        Get the persistent test result cache file for the current output.
+        
+        The key is a BLAKE2b digest over the project tree, the test cases
+        file and any start/shutdown scripts next to the project, so a result
+        is reused across runs only when all of them are identical. Project
+        files are hashed by content, except files over 1 MB and files in
+        hidden and build output directories, which are keyed by size and
+        modification time instead of being read.
+        
+        Args:
+            output_path: Path to the translated project
+            
+        Returns:
+            Cache file path, or None if caching is disabled or there are no test cases
+        """
+        if self.cache_dir is None or not self.test_cases_path:
+            return None
+        
+        try:
+            # Every file, including the test cases and scripts, goes through
+            # the per-file digest cache and is only read again when it changed
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self._get_file_hash(self.test_cases_path, os.stat(self.test_cases_path)))
+            # The test executor falls back to scripts next to the project
+            project_parent = os.path.dirname(os.path.realpath(output_path))
+            for script_name in ("start.sh", "shutdown.sh"):
+                script_path = os.path.join(project_parent, script_name)
+                try:
+                    script_stat = os.stat(script_path)
+                except FileNotFoundError:
+                    continue
+                if stat.S_ISREG(script_stat.st_mode):
+                    digest.update(self._get_file_hash(script_path, script_stat))
+            # Directories whose files are keyed by metadata only
+            metadata_only_roots = set()
+            for root, dirnames, filenames in os.walk(output_path):
+                dirnames.sort()
+                metadata_only = root in metadata_only_roots
+                for name in dirnames:
+                    if metadata_only or name.startswith('.') or name in _TEST_CACHE_SKIP_DIRS:
+                        metadata_only_roots.add(os.path.join(root, name))
+                for filename in sorted(filenames):
+                    file_path = os.path.join(root, filename)
+                    file_stat = os.stat(file_path)
+                    relative_path = os.path.relpath(file_path, output_path).encode('utf-8')
+                    digest.update(len(relative_path).to_bytes(8, 'little'))
+                    digest.update(relative_path)
+                    if metadata_only or file_stat.st_size > _TEST_CACHE_MAX_FILE_SIZE:
+                        digest.update(b'M')
+                        digest.update(file_stat.st_size.to_bytes(8, 'little'))
+                        digest.update(file_stat.st_mtime_ns.to_bytes(16, 'little', signed=True))
+                    else:
+                        digest.update(b'C')
+                        digest.update(self._get_file_hash(file_path, file_stat))
+        except OSError as e:
+            logger.warning("Could not hash project for the test result cache: %s", e)
+            return None
+        
+        return self.cache_dir / "test_results" / f"{digest.hexdigest()}.json"
+    
+    def _get_file_hash(self, file_path: str, file_stat: os.stat_result) -> bytes:
+        """
+        Get the BLAKE2b digest of a file, rehashing it only when it changed.
+        
+        Args:
+            file_path: Path to the file
+            file_stat: Result of os.stat() for the file
+            
+        Returns:
+            16-byte digest of the file content
+        """
+        cached = self._file_hash_cache.get(file_path)
+        if cached is not None and cached[0] == file_stat.st_mtime_ns and cached[1] == file_stat.st_size:
+            return cached[2]
+        
+        file_digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            while chunk := f.read(_TEST_CACHE_READ_CHUNK_SIZE):
+                file_digest.update(chunk)
+        file_hash = file_digest.digest()
+        
+        self._file_hash_cache[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, file_hash)
+        return file_hash
+    
+    def _load_cached_test_result(self, cache_file: Optional[Path]) -> Optional[TestExecutionResult]:
+        """
+        Load a test result from the persistent test result cache.
+        
+        Args:
+            cache_file: Cache file path (None if caching is disabled)
+            
+        Returns:
+            Cached TestExecutionResult or None on a cache miss
+        """
+        if cache_file is None or not cache_file.is_file():
+            return None
+        
+        try:
+            test_result = TestExecutionResult(**json_loads(cache_file.read_bytes()))
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("Ignoring unreadable cached test result %s: %s", cache_file, e)
+            return None
+        
+        logger.info("Using cached test result: %s", cache_file)
+        return test_result
+    
+    def _store_cached_test_result(self, cache_file: Optional[Path], test_result: TestExecutionResult) -> None:
+        """
+        Store a test result in the persistent test result cache.
+        
+        Only results where the service started are stored; build and startup
+        failures can be caused by the environment and are always rerun.
+        
+        Args:
+            cache_file: Cache file path (None if caching is disabled)
+            test_result: Test result to store
+        """
+        if cache_file is None or not test_result.service_startup_success:
+            return
+        
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(json_dumps(asdict(test_result)))
+        except (OSError, TypeError) as e:
+            logger.warning("Could not cache test result: %s", e)
+    
     def _test_translated_project(self, output_path: str) -> TestExecutionResult:
         """
         Test the translated project.
@@ -364,10 +853,10 @@ Make sure to test your understanding of the errors before providing the translat
         Returns:
             TestExecutionResult object
         """
-        console.print(f"[blue]🧪 Testing translated project...[/blue]")
+        console.print("[blue]🧪 Testing translated project...[/blue]")
         
         if not self.test_cases_path:
-            console.print(f"[yellow]⚠️  No test cases provided, skipping testing[/yellow]")
+            console.print("[yellow]⚠️  No test cases provided, skipping testing[/yellow]")
             return TestExecutionResult(
                 success=True,
                 build_success=True,
@@ -379,8 +868,10 @@ Make sure to test your understanding of the errors before providing the translat
             )
         
         try:
-            test_executor = TestExecutor(output_path, self.test_cases_path)
-            return test_executor.execute_full_test()
+            # Reuse the executor across attempts, so the test cases are parsed once
+            if self._test_executor is None or self._test_executor.project_path != Path(output_path).resolve():
+                self._test_executor = TestExecutor(output_path, self.test_cases_path)
+            return self._test_executor.execute_full_test()
             
         except Exception as e:
             error_msg = f"Test execution failed: {str(e)}"
@@ -407,28 +898,27 @@ Make sure to test your understanding of the errors before providing the translat
         Returns:
             List of ErrorInfo objects
         """
-        errors = []
-        
-        # Analyze build errors
-        for build_error in test_result.build_errors:
-            error_info = self.error_analyzer.analyze_error(
-                build_error, project_path, ErrorType.BUILD_ERROR
-            )
-            errors.append(error_info)
-        
-        # Analyze service errors
-        for service_error in test_result.service_errors:
-            error_info = self.error_analyzer.analyze_error(
-                service_error, project_path, ErrorType.SERVICE_STARTUP_ERROR
+        # Setup errors are reported as-is; they are not caused by the translation
+        errors = [
+            ErrorInfo(
+                error_type=ErrorType.SETUP_ERROR,
+                message="Test setup is invalid",
+                context=setup_error
             )
-            errors.append(error_info)
+            for setup_error in test_result.setup_errors
+        ]
         
-        # Analyze test errors
-        for test_error in test_result.test_errors:
-            error_info = self.error_analyzer.analyze_error(
-                test_error, project_path, ErrorType.TEST_FAILURE
+        # Build, service and test errors are analyzed in one pass, in that order
+        analyze_error = self.error_analyzer.analyze_error
+        errors += [
+            analyze_error(error_output, project_path, error_type)
+            for error_outputs, error_type in (
+                (test_result.build_errors, ErrorType.BUILD_ERROR),
+                (test_result.service_errors, ErrorType.SERVICE_STARTUP_ERROR),
+                (test_result.test_errors, ErrorType.TEST_FAILURE)
             )
-            errors.append(error_info)
+            for error_output in error_outputs
+        ]
         
         # Analyze test results if available
         if test_result.test_results:
@@ -447,10 +937,7 @@ Make sure to test your understanding of the errors before providing the translat
         if not self.retry_attempts:
             return "No previous attempts to analyze."
         
-        all_errors = []
-        for attempt in self.retry_attempts:
-            all_errors.extend(attempt.errors)
-        
+        all_errors = [error for attempt in self.retry_attempts for error in attempt.errors]
         return self.error_analyzer.generate_error_feedback(all_errors, "")
     
     def _prepare_retry_with_feedback(self, errors: List[ErrorInfo], source_path: str):
@@ -577,10 +1064,10 @@ Make sure to test your understanding of the errors before providing the translat
             "retry_attempts": []
         }
         
-        with open(conversation_path, 'w', encoding='utf-8') as f:
-            json.dump(initial_data, f, indent=2, ensure_ascii=False)
+        with open(conversation_path, 'wb') as f:
+            f.write(json_dumps(initial_data, indent=True))
         
-        logger.info(f"Conversation saving setup: {conversation_path}")
+        logger.info("Conversation saving setup: %s", conversation_path)
         return str(conversation_path)
     
     def _save_retry_conversation(self, file_path: str, final_result: Dict[str, Any]):
@@ -602,37 +1089,13 @@ Make sure to test your understanding of the errors before providing the translat
                     "llm_provider": self.llm_provider.get_provider_info()
                 },
                 "final_result": final_result,
-                "retry_attempts": [
-                    {
-                        "attempt": attempt.attempt_number,
-                        "success": attempt.success,
-                        "errors": [
-                            {
-                                "type": error.error_type.value,
-                                "message": error.message,
-                                "file_path": error.file_path,
-                                "line_number": error.line_number,
-                                "context": error.context,
-                                "suggestions": error.suggestions
-                            }
-                            for error in attempt.errors
-                        ],
-                        "test_result": {
-                            "success": attempt.test_result.success if attempt.test_result else None,
-                            "build_success": attempt.test_result.build_success if attempt.test_result else None,
-                            "service_startup_success": attempt.test_result.service_startup_success if attempt.test_result else None,
-                            "test_success": attempt.test_result.test_success if attempt.test_result else None,
-                            "execution_time": attempt.test_result.execution_time if attempt.test_result else None
-                        } if attempt.test_result else None
-                    }
-                    for attempt in self.retry_attempts
-                ]
+                "retry_attempts": self._attempt_dicts
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+            with open(file_path, 'wb') as f:
+                f.write(json_dumps(conversation_data, indent=True))
             
-            logger.info(f"Retry conversation saved to: {file_path}")
+            logger.info("Retry conversation saved to: %s", file_path)
             
         except Exception as e:
-            logger.error(f"Error saving retry conversation: {str(e)}")
+            logger.error("Error saving retry conversation: %s", e)
@@ -5,19 +5,36 @@ This module provides functionality to execute tests against translated projects
 and collect results for the retry mechanism.
 """
 
+import os
+import signal
 import subprocess
+import threading
 import time
 import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 
-from ..core.test_runner import TestRunner
-from ..core.service_manager import ServiceManager
+from ..models import TestSuite
 from ..utils import get_logger
 
+if TYPE_CHECKING:
+    from ..core.test_runner import TestRunner
+
 logger = get_logger("test_executor")
 
+# Number of trailing output lines kept from each script stream
+_OUTPUT_TAIL_LINES = 200
+
+
+def _read_tail(stream, tail: deque, lock: threading.Lock):
+    """Append the lines of a script output stream to a bounded tail buffer."""
+    for line in stream:
+        with lock:
+            tail.append(line)
+
 
 @dataclass
 class TestExecutionResult:
@@ -31,6 +48,8 @@ class TestExecutionResult:
     test_errors: List[str]
     test_results: Optional[Dict[str, Any]] = None
     execution_time: float = 0.0
+    # Problems with the test environment itself, which retranslating cannot fix
+    setup_errors: List[str] = field(default_factory=list)
 
 
 class TestExecutor:
@@ -47,9 +66,19 @@ class TestExecutor:
             base_url: Base URL for the service
         """
         self.project_path = Path(project_path).resolve()
+        # Directories searched for the service scripts, as plain strings
+        # for the os.path checks in _find_script
+        self._script_dirs = (str(self.project_path), str(self.project_path.parent))
         self.test_cases_path = Path(test_cases_path).resolve()
         self.base_url = base_url
         self.logger = get_logger("test_executor")
+        # HTTP session for readiness checks, created on first use
+        self._session = None
+        # Test runner and parsed test cases, reused across test cycles; the
+        # test cases are reparsed only when the file's mtime changes
+        self._test_runner: Optional["TestRunner"] = None
+        self._test_suite: Optional[TestSuite] = None
+        self._test_suite_mtime: Optional[int] = None
         
         # Find start.sh and shutdown.sh scripts
         self.start_script = self._find_script("start.sh")
@@ -65,22 +94,21 @@ class TestExecutor:
         Returns:
             Path to the script or None if not found
         """
-        # Look in project root first
-        script_path = self.project_path / script_name
-        if script_path.exists():
-            return script_path
-        
-        # Look in parent directory (common pattern)
-        parent_script = self.project_path.parent / script_name
-        if parent_script.exists():
-            return parent_script
+        # Look in project root first, then in the parent directory (common pattern)
+        for script_dir in self._script_dirs:
+            script_path = os.path.join(script_dir, script_name)
+            if os.path.exists(script_path):
+                return Path(script_path)
         
         return None
     
-    def validate_setup(self) -> Tuple[bool, List[str]]:
+    def validate_setup(self, check_test_cases: bool = True) -> Tuple[bool, List[str]]:
         """
         Validate that the test setup is correct.
         
+        Args:
+            check_test_cases: Whether to check that the test cases file exists
+            
         Returns:
             Tuple of (is_valid, error_messages)
         """
@@ -89,7 +117,7 @@ class TestExecutor:
         if not self.project_path.exists():
             errors.append(f"Project path does not exist: {self.project_path}")
         
-        if not self.test_cases_path.exists():
+        if check_test_cases and not self.test_cases_path.exists():
             errors.append(f"Test cases file does not exist: {self.test_cases_path}")
         
         if not self.start_script:
@@ -100,6 +128,83 @@ class TestExecutor:
         
         return len(errors) == 0, errors
     
+    def _run_script(self, script: str, cwd: Path, timeout: float) -> Tuple[int, str, str]:
+        """
+        Run a project script, keeping only the tail of its output.
+        
+        Args:
+            script: Script command, e.g. "./start.sh"
+            cwd: Working directory for the script
+            timeout: Maximum run time in seconds
+            
+        Returns:
+            Tuple of (return_code, stdout_tail, stderr_tail)
+            
+        Raises:
+            subprocess.TimeoutExpired: If the script does not finish in time
+        """
+        process = subprocess.Popen(
+            [script],
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+            # Own process group, so a timeout can stop everything the script started
+            start_new_session=(os.name == "posix")
+        )
+        stdout_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        stderr_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+        tail_lock = threading.Lock()
+        readers = [
+            threading.Thread(target=_read_tail, args=(process.stdout, stdout_tail, tail_lock), daemon=True),
+            threading.Thread(target=_read_tail, args=(process.stderr, stderr_tail, tail_lock), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        
+        try:
+            return_code = process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._kill_process_tree(process)
+            raise
+        finally:
+            # Background processes started by the script may keep the pipes
+            # open, so the readers are not waited on indefinitely; a reader
+            # that is still running only appends under the lock
+            for reader in readers:
+                reader.join(timeout=1)
+        
+        with tail_lock:
+            return return_code, "".join(stdout_tail), "".join(stderr_tail)
+    
+    def _kill_process_tree(self, process: subprocess.Popen):
+        """
+        Stop a timed out script together with the processes it started.
+        
+        The script's process group is sent SIGTERM, then SIGKILL if it has
+        not exited within 5 seconds. Without process groups only the script
+        itself is killed.
+        
+        Args:
+            process: Script process started in its own session
+        """
+        if os.name != "posix":
+            process.kill()
+            process.wait()
+            return
+        
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            try:
+                process.wait(timeout=5)
+                return
+            except subprocess.TimeoutExpired:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        process.wait()
+    
     def build_project(self) -> Tuple[bool, List[str]]:
         """
         Build the project using the start script.
@@ -114,21 +219,22 @@ class TestExecutor:
         
         try:
             # Run the start script
-            result = subprocess.run(
-                ["./start.sh"],
-                cwd=self.start_script.parent,
-                capture_output=True,
-                text=True,
+            return_code, stdout, stderr = self._run_script(
+                "./start.sh",
+                self.start_script.parent,
                 timeout=300  # 5 minute timeout
             )
             
-            if result.returncode == 0:
+            if return_code == 0:
                 self.logger.info("Project build successful")
                 return True, []
             else:
-                error_msg = f"Build failed with return code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
+                error_msg = f"Build failed with return code {return_code}"
+                if stderr:
+                    error_msg += f": {stderr}"
+                # start.sh reports many errors (e.g. docker build) on stdout
+                if stdout:
+                    error_msg += f"\nOutput:\n{stdout}"
                 self.logger.error(error_msg)
                 return False, [error_msg]
                 
@@ -141,45 +247,27 @@ class TestExecutor:
             self.logger.error(error_msg)
             return False, [error_msg]
     
-    def start_service(self) -> Tuple[bool, List[str]]:
+    def _build_and_start(self) -> Tuple[bool, List[str], bool, List[str]]:
         """
-        Start the service and wait for it to be ready.
+        Build the project and start the service with a single start.sh run.
+        
+        start.sh both builds and starts the service, so it is run once with
+        the build timeout; the build succeeded if the script did, and the
+        service started if it then becomes ready. A failed build is already
+        conclusive, so the readiness wait is skipped.
         
         Returns:
-            Tuple of (success, error_messages)
+            Tuple of (build_success, build_errors, service_success, service_errors)
         """
-        if not self.start_script:
-            return False, ["No start script found"]
+        build_success, build_errors = self.build_project()
+        if not build_success:
+            return False, build_errors, False, []
         
-        self.logger.info("Starting service...")
+        if not self._wait_for_service():
+            return True, [], False, ["Service failed to become ready within timeout"]
         
-        try:
-            # Start the service
-            result = subprocess.run(
-                ["./start.sh"],
-                cwd=self.start_script.parent,
-                capture_output=True,
-                text=True,
-                timeout=120  # 2 minute timeout for startup
-            )
-            
-            if result.returncode != 0:
-                error_msg = f"Service startup failed with return code {result.returncode}"
-                if result.stderr:
-                    error_msg += f": {result.stderr}"
-                return False, [error_msg]
-            
-            # Wait for service to be ready
-            if not self._wait_for_service():
-                return False, ["Service failed to become ready within timeout"]
-            
-            self.logger.info("Service started successfully")
-            return True, []
-            
-        except subprocess.TimeoutExpired:
-            return False, ["Service startup timed out"]
-        except Exception as e:
-            return False, [f"Service startup failed: {str(e)}"]
+        self.logger.info("Service started successfully")
+        return True, [], True, []
     
     def _wait_for_service(self, timeout: int = 60) -> bool:
         """
@@ -192,39 +280,74 @@ class TestExecutor:
             True if service becomes ready, False otherwise
         """
         import requests
+        from requests.adapters import HTTPAdapter
         
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        
+        # Poll with exponential backoff starting at 50 ms, so a service that
+        # is already up is detected almost immediately
+        delay = 0.05
         start_time = time.time()
         while time.time() - start_time < timeout:
             try:
-                response = requests.get(f"{self.base_url}/health", timeout=5)
+                response = self._session.get(f"{self.base_url}/health", timeout=5)
                 if response.status_code == 200:
                     return True
             except requests.exceptions.RequestException:
                 pass
             
-            time.sleep(2)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 1.0)
         
         return False
     
-    def run_tests(self) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
+    def _preload_test_cases(self) -> Optional[TestSuite]:
+        """
+        Load the test cases ahead of the test run.
+        
+        Returns:
+            TestSuite instance or None if loading failed (the test runner then
+            loads and reports the error itself)
+        """
+        try:
+            mtime = self.test_cases_path.stat().st_mtime_ns
+            if self._test_suite is None or self._test_suite_mtime != mtime:
+                self._test_suite = TestSuite.load(str(self.test_cases_path))
+                self._test_suite_mtime = mtime
+            return self._test_suite
+        except Exception as e:
+            self.logger.warning(f"Could not preload test cases: {str(e)}")
+            return None
+    
+    def run_tests(self, test_suite: Optional[TestSuite] = None) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
         """
         Run tests against the service.
         
+        Args:
+            test_suite: Already loaded test cases (optional)
+        
         Returns:
             Tuple of (success, error_messages, test_results)
         """
         self.logger.info("Running tests...")
         
         try:
-            # Create test runner
-            test_runner = TestRunner(
-                str(self.project_path),
-                str(self.test_cases_path),
-                self.base_url
-            )
+            # Create the test runner once and reuse it for later test cycles
+            if self._test_runner is None:
+                from ..core.test_runner import TestRunner
+                self._test_runner = TestRunner(
+                    str(self.project_path),
+                    str(self.test_cases_path),
+                    self.base_url
+                )
+            self._test_runner.test_suite = test_suite
             
-            # Run tests
-            results = test_runner.run_tests()
+            # Run tests against the service this executor already started
+            results = self._test_runner.run_tests(manage_service=False)
             
             if results.get("success", False):
                 self.logger.info("All tests passed")
@@ -255,19 +378,17 @@ class TestExecutor:
         self.logger.info("Shutting down service...")
         
         try:
-            result = subprocess.run(
-                ["./shutdown.sh"],
-                cwd=self.shutdown_script.parent,
-                capture_output=True,
-                text=True,
+            return_code, stdout, stderr = self._run_script(
+                "./shutdown.sh",
+                self.shutdown_script.parent,
                 timeout=30
             )
             
-            if result.returncode == 0:
+            if return_code == 0:
                 self.logger.info("Service shutdown successful")
                 return True
             else:
-                self.logger.warning(f"Service shutdown warning: {result.stderr}")
+                self.logger.warning(f"Service shutdown warning: {stderr or stdout}")
                 return True  # Don't fail for shutdown issues
                 
         except Exception as e:
@@ -283,8 +404,26 @@ class TestExecutor:
         """
         start_time = time.time()
         
-        # Validate setup
-        is_valid, setup_errors = self.validate_setup()
+        # Without test cases there is nothing to test against
+        if not self.test_cases_path.exists():
+            return TestExecutionResult(
+                success=False,
+                build_success=False,
+                service_startup_success=False,
+                test_success=False,
+                build_errors=[],
+                service_errors=[],
+                test_errors=[],
+                setup_errors=[f"Test cases file does not exist: {self.test_cases_path}"]
+            )
+        
+        # Look the scripts up again, the project may have been rewritten
+        # since the previous cycle
+        self.start_script = self._find_script("start.sh")
+        self.shutdown_script = self._find_script("shutdown.sh")
+        
+        # Validate setup; the test cases file was checked above
+        is_valid, setup_errors = self.validate_setup(check_test_cases=False)
         if not is_valid:
             return TestExecutionResult(
                 success=False,
@@ -296,20 +435,24 @@ class TestExecutor:
                 test_errors=[]
             )
         
-        # Build project
-        build_success, build_errors = self.build_project()
-        
-        # Start service
-        service_success, service_errors = self.start_service()
+        # Build project and start service, loading the test cases in the
+        # background meanwhile
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            test_suite_future = executor.submit(self._preload_test_cases)
+            build_success, build_errors, service_success, service_errors = self._build_and_start()
+            test_suite = test_suite_future.result()
         
-        # Run tests (only if service started successfully)
         test_success = False
         test_errors = []
         test_results = None
         
+        if not build_success:
+            test_errors = ["Cannot run tests - build failed"]
+        
+        # Run tests (only if service started successfully)
         if service_success:
-            test_success, test_errors, test_results = self.run_tests()
-        else:
+            test_success, test_errors, test_results = self.run_tests(test_suite)
+        elif build_success:
             test_errors = ["Cannot run tests - service failed to start"]
         
         # Always try to shutdown
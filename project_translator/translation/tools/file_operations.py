@@ -7,15 +7,47 @@ the translation process.
 
 import os
 import json
+import mmap
+import stat
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from rich.console import Console
+from typing import Dict, Any, Optional, List, Tuple
 
 from project_translator.utils import get_logger, error_with_stacktrace
 
-console = Console()
+try:
+    import pathspec
+except ImportError:
+    pathspec = None
+
 logger = get_logger("file_operations")
 
+# Number of threads scanning directories when building the project tree
+_TREE_SCAN_WORKERS = 16
+
+# Dependency and build output directories left out of the project tree
+_TREE_SKIP_DIRS = frozenset({"node_modules", "__pycache__", "target", "build", ".git", "dist", "venv"})
+
+# Number of threads reading files for get_files
+_READ_WORKERS = 16
+
+# Maximum number of file reads kept in memory
+_FILE_CACHE_MAX_ENTRIES = 128
+
+# Number of leading bytes inspected when detecting binary files
+_BINARY_SNIFF_SIZE = 8192
+
+# Files larger than this are read through a memory mapping
+_MMAP_MIN_SIZE = 256 * 1024
+
+
+def _is_within(path: str, root: str) -> bool:
+    """Check whether a resolved path is the root directory or inside it."""
+    return path == root or path.startswith(root if root.endswith(os.sep) else root + os.sep)
+
 
 class FileOperationsTool:
     """Tool for handling file operations during translation."""
@@ -30,12 +62,61 @@ class FileOperationsTool:
         """
         self.source_path = Path(source_path).resolve()
         self.output_path = Path(output_path).resolve()
+        # String forms of the roots for the os.path based per-call checks
+        self._source_root = str(self.source_path)
+        self._output_root = str(self.output_path)
         
         # Ensure output directory exists
         self.output_path.mkdir(parents=True, exist_ok=True)
         
+        # Patterns from the source project's .gitignore, pruned from the
+        # project tree (None without a .gitignore or the pathspec package)
+        self._ignore_spec = self._load_ignore_spec()
+        
+        # Source directory descriptor, so reads resolve paths relative to it
+        # instead of walking from / on every call (None where unsupported)
+        self._source_fd: Optional[int] = None
+        if os.open in os.supports_dir_fd and os.stat in os.supports_dir_fd:
+            self._source_fd = os.open(self._source_root, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+            self._finalizer = weakref.finalize(self, os.close, self._source_fd)
+        
+        # get_file results keyed by requested path, stored with the
+        # (mtime_ns, size) of the file they were read from
+        self._file_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        # get_files reads from several threads at once
+        self._file_cache_lock = threading.Lock()
+        
         logger.info(f"FileOperationsTool initialized - Source: {self.source_path}, Output: {self.output_path}")
     
+    def _load_ignore_spec(self):
+        """Compile the source project's .gitignore patterns, if available."""
+        gitignore_path = os.path.join(self._source_root, '.gitignore')
+        if pathspec is None or not os.path.isfile(gitignore_path):
+            return None
+        
+        try:
+            with open(gitignore_path, 'r', encoding='utf-8') as f:
+                return pathspec.PathSpec.from_lines('gitwildmatch', f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable .gitignore: {str(e)}")
+            return None
+    
+    def _is_ignored(self, entry: os.DirEntry, is_dir: bool) -> bool:
+        """Check whether a directory entry is pruned from the project tree."""
+        if is_dir and entry.name in _TREE_SKIP_DIRS:
+            return True
+        if self._ignore_spec is None:
+            return False
+        
+        relative_path = os.path.relpath(entry.path, self._source_root).replace(os.sep, '/')
+        return self._ignore_spec.match_file(relative_path + '/' if is_dir else relative_path)
+    
+    def close(self):
+        """Close the source directory descriptor."""
+        if self._source_fd is not None:
+            self._finalizer()
+            self._source_fd = None
+    
     def get_file(self, file_path: str) -> Dict[str, Any]:
         """
         Get the content of a file from the source project.
@@ -48,45 +129,81 @@ class FileOperationsTool:
         """
         try:
             # Resolve the full path
-            full_path = self.source_path / file_path.lstrip('/')
+            full_path = os.path.join(self._source_root, file_path.lstrip('/'))
             
             # Security check - ensure path is within source directory
-            if not str(full_path.resolve()).startswith(str(self.source_path.resolve())):
+            if not _is_within(os.path.realpath(full_path), self._source_root):
                 return {
                     "success": False,
                     "error": f"Access denied: Path {file_path} is outside source directory"
                 }
             
-            if not full_path.exists():
+            # Get file metadata
+            relative_path = file_path.lstrip('/') or '.'
+            try:
+                if self._source_fd is not None:
+                    file_stat = os.stat(relative_path, dir_fd=self._source_fd)
+                else:
+                    file_stat = os.stat(full_path)
+            except FileNotFoundError:
                 return {
                     "success": False,
                     "error": f"File not found: {file_path}"
                 }
             
-            if not full_path.is_file():
+            if not stat.S_ISREG(file_stat.st_mode):
                 return {
                     "success": False,
                     "error": f"Path is not a file: {file_path}"
                 }
             
-            # Read file content
-            with open(full_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Get file metadata
-            stat = full_path.stat()
+            # Reuse the previous read if the file is unchanged
+            with self._file_cache_lock:
+                cached = self._file_cache.get(file_path)
+                if cached is not None:
+                    self._file_cache.move_to_end(file_path)
+            if cached is not None and cached[0] == file_stat.st_mtime_ns and cached[1] == file_stat.st_size:
+                logger.info(f"Successfully read file: {file_path} ({file_stat.st_size} bytes, cached)")
+                return cached[2]
+            
+            # Read file content; files with a NUL byte near the start are
+            # treated as binary and their content is not decoded
+            if self._source_fd is not None:
+                fd = os.open(relative_path, os.O_RDONLY, dir_fd=self._source_fd)
+            else:
+                fd = os.open(full_path, os.O_RDONLY)
+            with os.fdopen(fd, 'rb') as f:
+                if file_stat.st_size > _MMAP_MIN_SIZE:
+                    # Decode large files straight from a read-only mapping,
+                    # without first copying them into a bytes object
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        is_binary = mapped.find(b'\x00', 0, _BINARY_SNIFF_SIZE) != -1
+                        content = "" if is_binary else str(mapped, 'utf-8', 'replace')
+                else:
+                    head = f.read(_BINARY_SNIFF_SIZE)
+                    is_binary = b'\x00' in head
+                    content = "" if is_binary else (head + f.read()).decode('utf-8', errors='replace')
+            
+            # Normalize newlines the way text-mode reads did
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             
             result = {
                 "success": True,
                 "content": content,
                 "file_path": file_path,
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
-                "extension": full_path.suffix,
-                "is_binary": self._is_binary(content)
+                "size": file_stat.st_size,
+                "modified": file_stat.st_mtime,
+                "extension": os.path.splitext(full_path)[1],
+                "is_binary": is_binary
             }
             
-            logger.info(f"Successfully read file: {file_path} ({stat.st_size} bytes)")
+            with self._file_cache_lock:
+                self._file_cache[file_path] = (file_stat.st_mtime_ns, file_stat.st_size, result)
+                if len(self._file_cache) > _FILE_CACHE_MAX_ENTRIES:
+                    self._file_cache.popitem(last=False)
+            
+            logger.info(f"Successfully read file: {file_path} ({file_stat.st_size} bytes)")
             return result
             
         except Exception as e:
@@ -97,6 +214,32 @@ class FileOperationsTool:
                 "error": error_msg
             }
     
+    def get_files(self, file_paths: List[str]) -> Dict[str, Any]:
+        """
+        Get the contents of several files from the source project.
+        
+        The files are read concurrently, so a burst of reads overlaps its
+        disk I/O instead of paying for each read in turn.
+        
+        Args:
+            file_paths: Paths to the files relative to source project root
+            
+        Returns:
+            Dictionary with the get_file result of each path
+        """
+        unique_paths = list(dict.fromkeys(file_paths))
+        if len(unique_paths) <= 1:
+            files = {file_path: self.get_file(file_path) for file_path in unique_paths}
+        else:
+            with ThreadPoolExecutor(max_workers=min(_READ_WORKERS, len(unique_paths))) as executor:
+                files = dict(zip(unique_paths, executor.map(self.get_file, unique_paths)))
+        
+        return {
+            "success": all(result["success"] for result in files.values()),
+            "files": files,
+            "count": len(files)
+        }
+    
     def write_file(self, file_path: str, content: str) -> Dict[str, Any]:
         """
         Write content to a file in the output project.
@@ -110,33 +253,32 @@ class FileOperationsTool:
         """
         try:
             # Resolve the full path
-            full_path = self.output_path / file_path.lstrip('/')
+            full_path = os.path.join(self._output_root, file_path.lstrip('/'))
             
             # Security check - ensure path is within output directory
-            if not str(full_path.resolve()).startswith(str(self.output_path.resolve())):
+            if not _is_within(os.path.realpath(full_path), self._output_root):
                 return {
                     "success": False,
                     "error": f"Access denied: Path {file_path} is outside output directory"
                 }
             
             # Create parent directories if they don't exist
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+            os.makedirs(os.path.dirname(full_path), exist_ok=True)
             
-            # Write file content
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            # Get file metadata
-            stat = full_path.stat()
+            # Encode once and write the bytes in a single call
+            data = content.encode('utf-8')
+            with open(full_path, 'wb') as f:
+                f.write(data)
+            size = len(data)
             
             result = {
                 "success": True,
                 "file_path": file_path,
-                "size": stat.st_size,
+                "size": size,
                 "message": f"File written successfully: {file_path}"
             }
             
-            logger.info(f"Successfully wrote file: {file_path} ({stat.st_size} bytes)")
+            logger.info(f"Successfully wrote file: {file_path} ({size} bytes)")
             return result
             
         except Exception as e:
@@ -158,40 +300,48 @@ class FileOperationsTool:
             Dictionary with directory contents
         """
         try:
-            # Handle root directory
-            if directory_path == "/":
-                full_path = self.source_path
+            # Handle root directory; entry paths are built as plain strings
+            # under this prefix instead of through Path.relative_to
+            relative_dir = os.path.normpath(directory_path.lstrip('/') or '.')
+            if relative_dir == '.':
+                full_path = self._source_root
+                prefix = ''
             else:
-                full_path = self.source_path / directory_path.lstrip('/')
+                full_path = os.path.join(self._source_root, relative_dir)
+                prefix = relative_dir + os.sep
             
             # Security check
-            if not str(full_path.resolve()).startswith(str(self.source_path.resolve())):
+            if not _is_within(os.path.realpath(full_path), self._source_root):
                 return {
                     "success": False,
                     "error": f"Access denied: Path {directory_path} is outside source directory"
                 }
             
-            if not full_path.exists():
+            try:
+                dir_stat = os.stat(full_path)
+            except FileNotFoundError:
                 return {
                     "success": False,
                     "error": f"Directory not found: {directory_path}"
                 }
             
-            if not full_path.is_dir():
+            if not stat.S_ISDIR(dir_stat.st_mode):
                 return {
                     "success": False,
                     "error": f"Path is not a directory: {directory_path}"
                 }
             
             # List directory contents
+            with os.scandir(full_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
             items = []
-            for item in sorted(full_path.iterdir()):
-                relative_path = item.relative_to(self.source_path)
+            for entry in entries:
+                is_file = entry.is_file()
                 items.append({
-                    "name": item.name,
-                    "path": str(relative_path),
-                    "type": "directory" if item.is_dir() else "file",
-                    "size": item.stat().st_size if item.is_file() else None
+                    "name": entry.name,
+                    "path": prefix + entry.name,
+                    "type": "directory" if entry.is_dir() else "file",
+                    "size": entry.stat().st_size if is_file else None
                 })
             
             result = {
@@ -250,18 +400,7 @@ class FileOperationsTool:
                     "extension": path.suffix
                 }
             elif path.is_dir():
-                children = []
-                for child in sorted(path.iterdir()):
-                    if child.name.startswith('.'):
-                        continue  # Skip hidden files
-                    children.append(self._build_tree(child, root_path))
-                
-                return {
-                    "name": path.name,
-                    "type": "directory",
-                    "children": children,
-                    "count": len(children)
-                }
+                return self._build_directory_node(str(path), path.name)
         except Exception as e:
             error_with_stacktrace(f"Error processing {path}", e)
             return {
@@ -270,14 +409,80 @@ class FileOperationsTool:
                 "error": str(e)
             }
     
-    def _is_binary(self, content: str) -> bool:
-        """Check if content appears to be binary."""
-        try:
-            # Try to encode as UTF-8, if it fails it might be binary
-            content.encode('utf-8')
-            return False
-        except UnicodeEncodeError:
-            return True
+    def _build_directory_node(self, path: str, name: str) -> Dict[str, Any]:
+        """
+        Build the tree node of a directory.
+        
+        The tree is walked level by level, and the directories of each level
+        are scanned concurrently so slow directory reads (e.g. on network or
+        overlay filesystems) overlap.
+        """
+        root = {"name": name, "type": "directory", "children": [], "count": 0}
+        pending = [(path, root)]
+        with ThreadPoolExecutor(max_workers=_TREE_SCAN_WORKERS) as executor:
+            while pending:
+                futures = [(dir_path, node, executor.submit(self._scan_directory, dir_path))
+                           for dir_path, node in pending]
+                pending = []
+                for dir_path, node, future in futures:
+                    try:
+                        children, subdirectories = future.result()
+                    except Exception as e:
+                        error_with_stacktrace(f"Error processing {dir_path}", e)
+                        error_node = {"name": node["name"], "type": "error", "error": str(e)}
+                        node.clear()
+                        node.update(error_node)
+                        continue
+                    node["children"] = children
+                    node["count"] = len(children)
+                    pending.extend(subdirectories)
+        return root
+    
+    def _scan_directory(self, path: str) -> Tuple[List[Dict[str, Any]], List[Tuple[str, Dict[str, Any]]]]:
+        """
+        Scan one directory for the project tree.
+        
+        Args:
+            path: Directory path
+            
+        Returns:
+            Tuple of (child nodes, (path, node) pairs of subdirectories whose
+            children are still to be filled in)
+        """
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+        
+        children = []
+        subdirectories = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue  # Skip hidden files
+            try:
+                if entry.is_file():
+                    if self._is_ignored(entry, is_dir=False):
+                        continue
+                    children.append({
+                        "name": entry.name,
+                        "type": "file",
+                        "size": entry.stat().st_size,
+                        "extension": os.path.splitext(entry.name)[1]
+                    })
+                elif entry.is_dir():
+                    if self._is_ignored(entry, is_dir=True):
+                        continue
+                    node = {"name": entry.name, "type": "directory", "children": [], "count": 0}
+                    children.append(node)
+                    subdirectories.append((entry.path, node))
+                else:
+                    children.append(None)
+            except Exception as e:
+                error_with_stacktrace(f"Error processing {entry.path}", e)
+                children.append({
+                    "name": entry.name,
+                    "type": "error",
+                    "error": str(e)
+                })
+        return children, subdirectories
     
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
@@ -298,13 +503,13 @@ class FileOperationsTool:
                     "error": f"File not found: {file_path}"
                 }
             
-            stat = full_path.stat()
+            file_stat = full_path.stat()
             
             return {
                 "success": True,
                 "file_path": file_path,
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
+                "size": file_stat.st_size,
+                "modified": file_stat.st_mtime,
                 "extension": full_path.suffix,
                 "is_file": full_path.is_file(),
                 "is_directory": full_path.is_dir()
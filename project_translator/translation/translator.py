@@ -5,15 +5,14 @@ This module implements the core translation engine that routes
 translation requests to the appropriate translator based on the method.
 """
 
-from typing import Dict, Any, Optional
-from rich.console import Console
+from functools import cached_property
+from typing import Dict, Any, Optional, Union
 
 from .llm_providers.base import BaseLLMProvider
 from .mcp_translator import MCPProjectTranslator
 from .batch_translator import BatchProjectTranslator
 from project_translator.utils import get_logger
 
-console = Console()
 logger = get_logger("translator")
 
 
@@ -36,13 +35,14 @@ class ProjectTranslator:
         self.target_lang = target_lang
         self.translation_method = translation_method.lower()
         
-        # Initialize appropriate translator
+        logger.info("ProjectTranslator initialized: %s -> %s (method: %s)", source_lang, target_lang, translation_method)
+    
+    @cached_property
+    def translator(self) -> Union[MCPProjectTranslator, BatchProjectTranslator]:
+        """Translator for the configured method, created on first use."""
         if self.translation_method == "batch":
-            self.translator = BatchProjectTranslator(llm_provider, source_lang, target_lang)
-        else:
-            self.translator = MCPProjectTranslator(llm_provider, source_lang, target_lang)
-        
-        logger.info(f"ProjectTranslator initialized: {source_lang} -> {target_lang} (method: {translation_method})")
+            return BatchProjectTranslator(self.llm_provider, self.source_lang, self.target_lang)
+        return MCPProjectTranslator(self.llm_provider, self.source_lang, self.target_lang)
     
     def translate_project(self, source_path: str, output_path: str, 
                          max_iterations: int = 50,
@@ -54,7 +54,10 @@ class ProjectTranslator:
                          max_retries: int = 3,
                          retry_delay: float = 1.0,
                          test_cases_path: Optional[str] = None,
-                         enable_auto_testing: bool = True) -> Dict[str, Any]:
+                         enable_auto_testing: bool = True,
+                         cache_dir: Optional[str] = None,
+                         request_timeout: Optional[float] = None,
+                         max_output_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
         Translate a project from source to target language.
         
@@ -71,6 +74,9 @@ class ProjectTranslator:
             retry_delay: Delay between retries in seconds
             test_cases_path: Path to test cases file for automatic testing
             enable_auto_testing: Whether to enable automatic testing and retry
+            cache_dir: Directory for cached LLM responses and test results
+            request_timeout: Timeout in seconds for each batch LLM call
+            max_output_tokens: Output token limit for each batch LLM call
             
         Returns:
             Dictionary with translation results
@@ -79,7 +85,8 @@ class ProjectTranslator:
         return self.translator.translate_project(
             source_path, output_path, max_iterations, save_conversation,
             conversation_file, conversation_dir, auto_save_interval,
-            retry_on_error, max_retries, retry_delay, test_cases_path, enable_auto_testing
+            retry_on_error, max_retries, retry_delay, test_cases_path, enable_auto_testing,
+            cache_dir, request_timeout, max_output_tokens
         )
     
     def get_translation_summary(self) -> Dict[str, Any]:
@@ -6,16 +6,22 @@ logging configuration, and helper classes used throughout the application.
 """
 
 from .config import Config, LoggingConfig
-from .validators import PathValidator, ResponseValidator
+from .validators import PathValidator, ResponseValidator, ValidationResult
 from .logging_config import setup_logging, get_logger, get_log_file_path, error_with_stacktrace
+from .serialization import json_dumps, json_loads
+from .console import get_console
 
 __all__ = [
     "Config",
     "LoggingConfig",
     "PathValidator", 
     "ResponseValidator",
+    "ValidationResult",
     "setup_logging",
     "get_logger",
     "get_log_file_path",
-    "error_with_stacktrace"
+    "error_with_stacktrace",
+    "json_dumps",
+    "json_loads",
+    "get_console"
 ]
@@ -0,0 +1,28 @@
+"""
+Shared console module.
+
+This module provides the Rich console shared by the CLI commands, the
+test runner components and the logging configuration.
+"""
+
+from typing import Optional
+from rich.console import Console
+
+# Shared console, created on first use
+_console: Optional[Console] = None
+
+
+def get_console() -> Console:
+    """
+    Get the shared Rich console.
+
+    Terminal detection runs once for the whole application, and console
+    output and Rich log records are written through the same instance.
+
+    Returns:
+        Console instance
+    """
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
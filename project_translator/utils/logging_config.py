@@ -5,14 +5,24 @@ This module provides centralized logging configuration with file output
 and structured logging for better debugging and monitoring.
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 from rich.logging import RichHandler
-from rich.console import Console
+
+from .console import get_console
+
+
+# Default log file path, computed once per process by the first logger
+_default_log_file: Optional[str] = None
+_default_log_file_lock = threading.Lock()
 
 
 class ProjectTranslatorLogger:
@@ -33,17 +43,23 @@ class ProjectTranslatorLogger:
         self.log_file = log_file or self._get_default_log_file()
         self.max_file_size = max_file_size
         self.backup_count = backup_count
-        self.console = Console()
+        self.console = get_console()
         
         self._setup_logging()
     
     def _get_default_log_file(self) -> str:
-        """Get default log file path."""
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
+        """Get default log file path, creating the log directory on first use."""
+        global _default_log_file
         
-        # Use a consistent log file name instead of timestamped files
-        return str(log_dir / "project_translator.log")
+        with _default_log_file_lock:
+            if _default_log_file is None:
+                log_dir = Path("logs")
+                log_dir.mkdir(exist_ok=True)
+                
+                # Use a consistent log file name instead of timestamped files
+                _default_log_file = str(log_dir / "project_translator.log")
+            
+            return _default_log_file
     
     def _setup_logging(self):
         """Set up logging configuration."""
@@ -92,13 +108,44 @@ class ProjectTranslatorLogger:
         file_handler.setLevel(logging.DEBUG)  # Always log everything to file
         file_handler.setFormatter(detailed_formatter)
         
-        # Add handlers to logger
-        self.logger.addHandler(console_handler)
-        self.logger.addHandler(file_handler)
+        # File output runs on a background listener thread, so callers never
+        # block on disk I/O; the console handler stays synchronous so log
+        # lines keep their order relative to console.print output
+        self.console_handler = console_handler
+        self.file_handler = file_handler
+        self._listener = None
+        self._start_listener()
         
         # Prevent propagation to root logger
         self.logger.propagate = False
     
+    def _start_listener(self):
+        """Attach the console handler and a queue for the file handler, and start its listener thread."""
+        self.logger.handlers.clear()
+        
+        log_queue = queue.SimpleQueue()
+        self._listener = logging.handlers.QueueListener(
+            log_queue,
+            self.file_handler,
+            respect_handler_level=True
+        )
+        self.logger.addHandler(self.console_handler)
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener.start()
+    
+    def _attach_direct_handlers(self):
+        """Attach the console and file handlers to the logger without a queue."""
+        self.logger.handlers.clear()
+        self._listener = None
+        self.logger.addHandler(self.console_handler)
+        self.logger.addHandler(self.file_handler)
+    
+    def _stop_listener(self):
+        """Stop the listener thread after it has handled all queued records."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+    
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """
         Get a logger instance.
@@ -124,9 +171,7 @@ class ProjectTranslatorLogger:
         self.logger.setLevel(self.log_level)
         
         # Update console handler level
-        for handler in self.logger.handlers:
-            if isinstance(handler, RichHandler):
-                handler.setLevel(self.log_level)
+        self.console_handler.setLevel(self.log_level)
     
     def get_log_file_path(self) -> str:
         """Get the current log file path."""
@@ -188,7 +233,8 @@ class ProjectTranslatorLogger:
             self.logger.error(f"Error: {str(error)}")
         
         # Log full traceback at DEBUG level
-        self.logger.debug("Full traceback:", exc_info=True)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Full traceback:", exc_info=True)
     
     def error_with_stacktrace(self, message: str, exception: Exception = None):
         """
@@ -210,9 +256,12 @@ class ProjectTranslatorLogger:
     
     def cleanup(self):
         """Clean up logging handlers and close file handles."""
+        self._stop_listener()
         for handler in self.logger.handlers[:]:
             handler.close()
             self.logger.removeHandler(handler)
+        self.console_handler.close()
+        self.file_handler.close()
 
 
 # Global logger instance
@@ -241,6 +290,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> Pr
             _logger_instance.set_level(log_level)
         if log_file and _logger_instance.log_file != log_file:
             # Recreate logger with new file path
+            _logger_instance.cleanup()
             _logger_instance = ProjectTranslatorLogger(log_level, log_file)
     
     return _logger_instance
@@ -290,3 +340,22 @@ def cleanup_logging():
     if _logger_instance is not None:
         _logger_instance.cleanup()
         _logger_instance = None
+
+
+def _stop_logging_listener():
+    """Flush queued log records before the interpreter exits."""
+    if _logger_instance is not None:
+        _logger_instance._stop_listener()
+
+
+def _log_directly_after_fork():
+    """Bypass the queue in a forked child process."""
+    if _logger_instance is not None and _logger_instance._listener is not None:
+        _logger_instance._attach_direct_handlers()
+
+
+atexit.register(_stop_logging_listener)
+if hasattr(os, "register_at_fork"):
+    # The listener thread does not survive fork, and worker processes exit
+    # without running atexit hooks, so forked children log synchronously
+    os.register_at_fork(after_in_child=_log_directly_after_fork)
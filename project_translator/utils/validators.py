@@ -5,88 +5,178 @@ This module provides validation functions for paths, responses,
 and other data structures used in the CLI application.
 """
 
-from pathlib import Path
-from typing import Dict, Any, List, Optional
-from rich.console import Console
+import logging
+import os
+import stat
+from typing import Dict, Any, List, NamedTuple, Optional
 
-console = Console()
+from .console import get_console
 
+# Child of the project logger; taken directly from logging so importing the
+# utils package does not set up logging as a side effect
+logger = logging.getLogger("project_translator.validators")
 
-class PathValidator:
-    """Validates file and directory paths."""
+# Python classes of the response types understood by validate_response_type;
+# any other expected type fails the check
+_RESPONSE_TYPES: Dict[str, type] = {
+    "array": list,
+    "object": dict
+}
+
+
+class ValidationResult(NamedTuple):
+    """Outcome of a validation, with the reason when it failed."""
+    ok: bool
+    reason: Optional[str] = None
+
+
+# Shared result for every successful validation
+_VALID = ValidationResult(True)
+
+
+def _lookup(path: str) -> Optional[os.stat_result]:
+    """
+    Get the stat result of a path with a single stat call.
     
-    @staticmethod
-    def validate_directory(path: str) -> bool:
-        """
-        Validate that a path is an existing directory.
+    Args:
+        path: Path to look up
         
-        Args:
-            path: Path to validate
-            
-        Returns:
-            True if valid directory, False otherwise
-        """
-        try:
-            path_obj = Path(path).resolve()
-            if not path_obj.exists():
-                console.print(f"[red]Path does not exist: {path}[/red]")
-                return False
-            if not path_obj.is_dir():
-                console.print(f"[red]Path is not a directory: {path}[/red]")
-                return False
-            return True
-        except Exception as e:
-            console.print(f"[red]Error validating directory path: {e}[/red]")
-            return False
+    Returns:
+        os.stat_result, or None if the path does not exist
+        
+    Raises:
+        OSError: If the path exists but cannot be stat'ed
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _check_directory(path: str) -> ValidationResult:
+    """Check that a path is an existing directory."""
+    try:
+        st = _lookup(path)
+        if st is None:
+            return ValidationResult(False, f"Path does not exist: {path}")
+        if not stat.S_ISDIR(st.st_mode):
+            return ValidationResult(False, f"Path is not a directory: {path}")
+        return _VALID
+    except Exception as e:
+        return ValidationResult(False, f"Error validating directory path: {e}")
+
+
+def _check_file(path: str) -> ValidationResult:
+    """Check that a path is an existing file."""
+    try:
+        st = _lookup(path)
+        if st is None:
+            return ValidationResult(False, f"File does not exist: {path}")
+        if not stat.S_ISREG(st.st_mode):
+            return ValidationResult(False, f"Path is not a file: {path}")
+        return _VALID
+    except Exception as e:
+        return ValidationResult(False, f"Error validating file path: {e}")
+
+
+def _check_executable(path: str) -> ValidationResult:
+    """Check that a path is an executable file."""
+    try:
+        st = _lookup(path)
+        if st is None:
+            return ValidationResult(False, f"File does not exist: {path}")
+        if not stat.S_ISREG(st.st_mode):
+            return ValidationResult(False, f"Path is not a file: {path}")
+        # access() asks the kernel whether the current user may execute the
+        # file, which the mode bits alone cannot tell
+        if not os.access(path, os.X_OK):
+            return ValidationResult(False, f"File is not executable: {path}")
+        return _VALID
+    except Exception as e:
+        return ValidationResult(False, f"Error validating executable path: {e}")
+
+
+def _emit(message: str) -> None:
+    """Report a validation failure as configured on PathValidator."""
+    if not PathValidator.verbose:
+        return
+    if PathValidator.use_console:
+        # Fetched here so importing validators does not create the console
+        get_console().print(f"[red]{message}[/red]")
+    else:
+        logger.error(message)
+
+
+def validate_directory(path: str) -> bool:
+    """
+    Validate that a path is an existing directory.
     
-    @staticmethod
-    def validate_file(path: str) -> bool:
-        """
-        Validate that a path is an existing file.
+    Args:
+        path: Path to validate
         
-        Args:
-            path: Path to validate
-            
-        Returns:
-            True if valid file, False otherwise
-        """
-        try:
-            path_obj = Path(path).resolve()
-            if not path_obj.exists():
-                console.print(f"[red]File does not exist: {path}[/red]")
-                return False
-            if not path_obj.is_file():
-                console.print(f"[red]Path is not a file: {path}[/red]")
-                return False
-            return True
-        except Exception as e:
-            console.print(f"[red]Error validating file path: {e}[/red]")
-            return False
+    Returns:
+        True if valid directory, False otherwise
+    """
+    result = _check_directory(path)
+    if not result.ok:
+        _emit(result.reason)
+    return result.ok
+
+
+def validate_file(path: str) -> bool:
+    """
+    Validate that a path is an existing file.
     
-    @staticmethod
-    def validate_executable(path: str) -> bool:
-        """
-        Validate that a path is an executable file.
+    Args:
+        path: Path to validate
         
-        Args:
-            path: Path to validate
-            
-        Returns:
-            True if valid executable, False otherwise
-        """
-        try:
-            path_obj = Path(path).resolve()
-            if not PathValidator.validate_file(str(path_obj)):
-                return False
-            
-            if not path_obj.stat().st_mode & 0o111:
-                console.print(f"[red]File is not executable: {path}[/red]")
-                return False
-            
-            return True
-        except Exception as e:
-            console.print(f"[red]Error validating executable path: {e}[/red]")
-            return False
+    Returns:
+        True if valid file, False otherwise
+    """
+    result = _check_file(path)
+    if not result.ok:
+        _emit(result.reason)
+    return result.ok
+
+
+def validate_executable(path: str) -> bool:
+    """
+    Validate that a path is an executable file.
+    
+    Args:
+        path: Path to validate
+        
+    Returns:
+        True if valid executable, False otherwise
+    """
+    result = _check_executable(path)
+    if not result.ok:
+        _emit(result.reason)
+    return result.ok
+
+
+class PathValidator:
+    """
+    Validates file and directory paths.
+    
+    The validators are also available as module-level functions, which
+    hot call sites can use without going through the class.
+    """
+    
+    # Whether failures are reported at all, and whether they are printed on
+    # the Rich console (as before) or go through the logger instead
+    verbose: bool = True
+    use_console: bool = True
+    
+    # Checks that return a ValidationResult without reporting failures
+    check_directory = staticmethod(_check_directory)
+    check_file = staticmethod(_check_file)
+    check_executable = staticmethod(_check_executable)
+    
+    # Checks that report failures and return a bool
+    validate_directory = staticmethod(validate_directory)
+    validate_file = staticmethod(validate_file)
+    validate_executable = staticmethod(validate_executable)
 
 
 class ResponseValidator:
@@ -121,13 +211,10 @@ class ResponseValidator:
         if not isinstance(response_data, dict):
             return False
         
-        for key, expected_value in expected_structure.items():
-            if key not in response_data:
-                return False
-            if response_data[key] != expected_value:
-                return False
-        
-        return True
+        # Subset test on the item views runs in C: it returns False at once
+        # when the response has fewer keys, then does one lookup and one
+        # equality check per expected key; values need not be hashable
+        return expected_structure.items() <= response_data.items()
     
     @staticmethod
     def validate_response_contains(response_data: Any, required_keys: List[str]) -> bool:
@@ -142,7 +229,8 @@ class ResponseValidator:
             True if all keys present, False otherwise
         """
         if isinstance(response_data, dict):
-            return all(key in response_data for key in required_keys)
+            # Set containment against the key view runs in C
+            return response_data.keys() >= frozenset(required_keys)
         elif isinstance(response_data, str):
             return all(key in response_data for key in required_keys)
         return False
@@ -159,11 +247,8 @@ class ResponseValidator:
         Returns:
             True if type matches, False otherwise
         """
-        if expected_type == "array":
-            return isinstance(response_data, list)
-        elif expected_type == "object":
-            return isinstance(response_data, dict)
-        return False
+        expected_class = _RESPONSE_TYPES.get(expected_type)
+        return expected_class is not None and isinstance(response_data, expected_class)
     
     @staticmethod
     def validate_item_count(response_data: Any, expected_count: int, min_count: Optional[int] = None) -> bool:
@@ -178,12 +263,20 @@ class ResponseValidator:
         Returns:
             True if count matches expectations, False otherwise
         """
-        if not isinstance(response_data, list):
-            return False
-        
-        actual_count = len(response_data)
+        return (isinstance(response_data, list)
+                and ResponseValidator.validate_item_count_fast(len(response_data), expected_count, min_count))
+    
+    @staticmethod
+    def validate_item_count_fast(actual_count: int, expected_count: int, min_count: Optional[int] = None) -> bool:
+        """
+        Validate an item count, for callers that already know the response is a list.
         
-        if min_count is not None:
-            return actual_count >= min_count
-        else:
-            return actual_count == expected_count
+        Args:
+            actual_count: Number of items in the response
+            expected_count: Expected exact count (if min_count is None)
+            min_count: Minimum count (if provided, overrides expected_count)
+            
+        Returns:
+            True if count matches expectations, False otherwise
+        """
+        return actual_count >= min_count if min_count is not None else actual_count == expected_count